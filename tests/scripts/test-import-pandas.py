@@ -1,17 +1,26 @@
 from __future__ import absolute_import, print_function
 
+import operator
 import sys
 
 from weatherlink.importer import Importer
+from weatherlink.models import ArchiveIntervalRecord, DailySummary, STRAIGHT_NUMBER, TENTHS, THOUSANDTHS, WindDirection
 from weatherlink.utils import calculate_all_record_values
 
-import functools
-import operator
-from datetime import datetime
+import numpy as np
 import pandas as pd
 pd.options.display.max_columns = 500
 pd.options.display.max_rows = 500
 
+SUMMARY_ATTRIBUTES = tuple(
+	item[0] for item in DailySummary.DAILY_SUMMARY_ATTRIBUTE_MAP if not item[0].endswith('_version')
+)
+RECORD_ATTRIBUTES = tuple(
+	item for item in ArchiveIntervalRecord.RECORD_ATTRIBUTE_MAP_WLK
+	if item[0] != '__special' and not item[0].endswith('_version')
+)
+get_record_values = operator.itemgetter(*(item[0] for item in RECORD_ATTRIBUTES))
+
 importer = Importer(sys.argv[1])
 
 print('Reading file %s' % importer.file_name)
@@ -21,53 +30,72 @@ print()
 
 importer.import_data()
 
-all_values = []
+# Raw record values are scaled integers; wind directions are compass point codes, with 255 meaning no direction
+SCALES = {STRAIGHT_NUMBER: 1, TENTHS: 0.1, THOUSANDTHS: 0.001}
+DEGREES_TABLE = np.full(256, np.nan)
+DEGREES_TABLE[:len(WindDirection)] = [d.degrees for d in WindDirection]
+DIRECTIONS_TABLE = np.full(256, None, dtype=object)
+DIRECTIONS_TABLE[:len(WindDirection)] = [d.name for d in WindDirection]
+
+# Only records from this date are collected into the data frame. They are held by the target day and, for the record
+# that ends at midnight, the day before it, so no other day needs to be looked at.
+TARGET_DATE = pd.Timestamp(sys.argv[2] if len(sys.argv) > 2 else '2020-08-29')
+
+
+def build_record_frame(records, day):
+	columns = {}
+	for name, converter, dash in RECORD_ATTRIBUTES:
+		raw = records[name]
+		if converter is WindDirection:
+			columns[f'{name}_degrees'] = DEGREES_TABLE[raw]
+			columns[name] = DIRECTIONS_TABLE[raw]
+		elif dash is None:
+			columns[name] = raw * SCALES[converter]
+		else:
+			columns[name] = np.where(raw == dash, np.nan, raw * SCALES[converter])
+	columns['datetime'] = (
+		pd.Timestamp(importer.year, importer.month, day) + pd.to_timedelta(records['minutes_past_midnight'], unit='m')
+	)
+	return pd.DataFrame(columns)
+
+
+derived_values = []
+record_frames = []
 for day, day_index in enumerate(importer.header.day_indexes):
 	if day > 0 and day_index.record_count > 0:
 		print('Day %s (%s records, offset %s):' % (day, day_index.record_count, day_index.start_index))
 		print('-' * 250)
 
 		summary = importer.daily_summaries[day]
-		output = ''
-		for item in summary.DAILY_SUMMARY_ATTRIBUTE_MAP:
-			if item[0][-8:] != '_version':
-				output += str(summary[item[0]] or '-') + '  '
+		output = ''.join([str(summary[name] or '-') + '  ' for name in SUMMARY_ATTRIBUTES])
 		print(f'summary -> {output}')
 		print('-' * 250)
 
 		assert day_index.record_count - 2 == len(importer.daily_records[day])
 
+		collect = (
+			(importer.year, importer.month) == (TARGET_DATE.year, TARGET_DATE.month) and
+			TARGET_DATE.day - 1 <= day <= TARGET_DATE.day
+		)
+		if collect:
+			frame = build_record_frame(importer.daily_records_array[day], day)
+			record_frames.append(frame[frame['datetime'].dt.normalize() == TARGET_DATE])
 
 		for record in importer.daily_records[day]:
-			values = calculate_all_record_values(record)
-			output = str(record.date) + '  (' + str(record.timestamp) + ')  '
-			for item in record.RECORD_ATTRIBUTE_MAP_WLK:
-				if item[0] != '__special' and item[0][-8:] != '_version':
-					output += str(record[item[0]] or '-') + '  '
-					if item[0].startswith("wind_direction"):
-						if record[item[0]]:
-							values[f"{item[0]}_degrees"] = record[item[0]].degrees
-							values[f"{item[0]}"] = record[item[0]]
-						else:
-							values[f"{item[0]}_degrees"] = None
-							values[f"{item[0]}"] = None
-					else:
-						values[item[0]] = record[item[0]] or None
-			output += str(record.rain_amount) + '  ' + str(record.rain_rate) + '  '
-			values['datetime'] = str(record.date)
-			all_values.append(values)
-			# print(values)
+			if collect and record.date.date() == TARGET_DATE.date():
+				derived_values.append(calculate_all_record_values(record))
+			parts = [str(record.date), '(%s)' % record.timestamp]
+			parts.extend(str(value or '-') for value in get_record_values(record))
+			parts.extend((str(record.rain_amount), str(record.rain_rate), ))
+			output = '  '.join(parts) + '  '
 			print(f'values -> {output}')
 
 		# print(importer.daily_records)
 		# print(type(importer.daily_records))
 
-df = pd.DataFrame(all_values)
-
-print(df.dtypes)
-
-df['date'] = df.datetime.str.slice(start=0, stop=10)
-# print(df.head())
-df = df[df.datetime.str.slice(start=0, stop=10) == '2020-08-29']
-
-print(df.T)
+if record_frames:
+	df = pd.concat([pd.DataFrame(derived_values), pd.concat(record_frames, ignore_index=True)], axis=1)
+	print(df.dtypes)
+	print(df.T)
+else:
+	print('No records for %s' % TARGET_DATE.date())
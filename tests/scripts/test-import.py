@@ -1,11 +1,22 @@
 from __future__ import absolute_import, print_function
 
+import operator
 import sys
 
 from weatherlink.importer import Importer
+from weatherlink.models import ArchiveIntervalRecord, DailySummary
 from weatherlink.utils import calculate_all_record_values
 
 
+SUMMARY_ATTRIBUTES = tuple(
+	item[0] for item in DailySummary.DAILY_SUMMARY_ATTRIBUTE_MAP if not item[0].endswith('_version')
+)
+RECORD_ATTRIBUTES = tuple(
+	item[0] for item in ArchiveIntervalRecord.RECORD_ATTRIBUTE_MAP_WLK
+	if item[0] != '__special' and not item[0].endswith('_version')
+)
+get_record_values = operator.itemgetter(*RECORD_ATTRIBUTES)
+
 importer = Importer(sys.argv[1])
 
 print('Reading file %s' % importer.file_name)
@@ -21,23 +32,18 @@ for day, day_index in enumerate(importer.header.day_indexes):
 		print('-' * 250)
 
 		summary = importer.daily_summaries[day]
-		output = ''
-		for item in summary.DAILY_SUMMARY_ATTRIBUTE_MAP:
-			if item[0][-8:] != '_version':
-				output += str(summary[item[0]] or '-') + '  '
+		output = ''.join([str(summary[name] or '-') + '  ' for name in SUMMARY_ATTRIBUTES])
 		print(output)
 		print('-' * 250)
 
 		assert day_index.record_count - 2 == len(importer.daily_records[day])
 
 		for record in importer.daily_records[day]:
-			output = str(record.date) + '  (' + str(record.timestamp) + ')  '
-			for item in record.RECORD_ATTRIBUTE_MAP_WLK:
-				if item[0] != '__special' and item[0][-8:] != '_version':
-					output += str(record[item[0]] or '-') + '  '
-			output += str(record.rain_amount) + '  ' + str(record.rain_rate) + '  '
+			parts = [str(record.date), '(%s)' % record.timestamp]
+			parts.extend(str(value or '-') for value in get_record_values(record))
+			parts.extend((str(record.rain_amount), str(record.rain_rate), ))
 			values = calculate_all_record_values(record)
-			output += '(plus %s calculated values)' % len(values)
-			print(output)
+			parts.append('(plus %s calculated values)' % len(values))
+			print('  '.join(parts))
 
 		print()
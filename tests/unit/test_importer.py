@@ -0,0 +1,85 @@
+from __future__ import absolute_import
+
+import bz2
+import os
+import shutil
+import tempfile
+from unittest import (
+	skipIf,
+	TestCase,
+)
+
+from weatherlink import (
+	importer,
+	utils,
+)
+from weatherlink.models import (
+	TENTHS,
+	WindDirection,
+)
+
+
+class TestImporter(TestCase):
+	@classmethod
+	def setUpClass(cls):
+		cls.directory = tempfile.mkdtemp()
+		cls.file_name = os.path.join(cls.directory, '2016-04.wlk')
+
+		source = os.path.join(
+			os.path.dirname(os.path.dirname(os.path.realpath(__file__))),
+			'data/sample-database-2016-04.wlk.bz2',
+		)
+		with bz2.BZ2File(source, 'rb') as compressed, open(cls.file_name, 'wb') as decompressed:
+			shutil.copyfileobj(compressed, decompressed)
+
+	@classmethod
+	def tearDownClass(cls):
+		shutil.rmtree(cls.directory)
+
+	def test_import_data(self):
+		i = importer.Importer(self.file_name)
+		i.import_data()
+
+		self.assertEqual(2016, i.year)
+		self.assertEqual(4, i.month)
+		self.assertEqual(7130, len(i.records))
+
+		for day, day_index in enumerate(i.header.day_indexes):
+			if day > 0 and day_index.record_count > 1:
+				self.assertIn(day, i.daily_summaries)
+				self.assertEqual(day_index.record_count - 2, len(i.daily_records[day]))
+
+		record = i.daily_records[1][0]
+		self.assertEqual(5, record.minutes_covered)
+		self.assertEqual(5, record.minutes_past_midnight)
+		self.assertEqual(TENTHS(632), record.temperature_outside)
+		self.assertEqual(WindDirection.W, record.wind_direction_prevailing)
+
+	@skipIf(importer.numpy is None, 'NumPy is not installed')
+	def test_import_data_array(self):
+		i = importer.Importer(self.file_name)
+		i.import_data()
+
+		for day, records in i.daily_records.items():
+			array = i.daily_records_array[day]
+			self.assertEqual(len(records), len(array))
+
+			for record, row in zip(records, array):
+				self.assertEqual(record.minutes_covered, row['minutes_covered'])
+				self.assertEqual(record.minutes_past_midnight, row['minutes_past_midnight'])
+				self.assertEqual(record.temperature_outside, TENTHS(int(row['temperature_outside'])))
+				self.assertEqual(record.rain_rate_clicks, row['rain_rate_clicks'])
+				if record.wind_direction_prevailing:
+					self.assertEqual(record.wind_direction_prevailing.value, row['wind_direction_prevailing'])
+				else:
+					self.assertEqual(255, row['wind_direction_prevailing'])
+
+	@skipIf(utils.numpy is None, 'NumPy is not installed')
+	def test_calculate_all_record_values_batch(self):
+		i = importer.Importer(self.file_name)
+		i.import_data()
+
+		self.assertEqual(
+			[utils.calculate_all_record_values(record) for record in i.records],
+			utils.calculate_all_record_values_batch(i.records),
+		)
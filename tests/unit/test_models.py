@@ -11,12 +11,14 @@ import struct
 from unittest import TestCase
 
 from weatherlink.models import (
+	calculate_weatherlink_crc,
 	convert_datetime_to_timestamp,
 	convert_timestamp_to_datetime,
 	BarometricTrend,
 	LoopRecord,
 	RainCollectorTypeSerial,
 	RainCollectorTypeDatabase,
+	RecordDict,
 	WindDirection,
 )
 
@@ -340,6 +342,24 @@ class TestRainCollectorTypeDatabase(TestCase):
 		self.assertEqual(Decimal('7.0'), RainCollectorTypeDatabase.millimeters_1_0.clicks_to_centimeters(70))
 
 
+class TestRecordDict(TestCase):
+	def test_attribute_access(self):
+		record = RecordDict(foo=1)
+		record.bar = 2
+
+		self.assertEqual(1, record.foo)
+		self.assertEqual(2, record['bar'])
+		self.assertEqual({'foo': 1, 'bar': 2}, record)
+
+	def test_missing_attribute(self):
+		with self.assertRaises(KeyError):
+			RecordDict().foo  # noqa
+
+	def test_no_instance_dict(self):
+		with self.assertRaises(AttributeError):
+			object.__getattribute__(LoopRecord(), '__dict__')
+
+
 class TestLoopRecord(TestCase):
 	def test_load_loop_1_from_connection_not_implemented(self):
 		with self.assertRaises(NotImplementedError):
@@ -508,3 +528,22 @@ class TestLoopRecord(TestCase):
 			self.assertIsNone(record.solar_radiation)
 			self.assertIsNone(record.evapotranspiration)
 			self.assertEqual(15, record.minute_in_hour)
+
+
+class TestWeatherLinkCRC(TestCase):
+	def test_calculate_crc(self):
+		# This example comes from the Vantage Serial Protocol documentation
+		self.assertEqual(0xE2B4, calculate_weatherlink_crc(b'\xC6\xCE\xA2\x03'))
+		self.assertEqual(0xE2B4, calculate_weatherlink_crc(bytearray(b'\xC6\xCE\xA2\x03')))
+		self.assertEqual(0xE2B4, calculate_weatherlink_crc(memoryview(b'\xC6\xCE\xA2\x03')))
+		self.assertEqual(0xE2B4, calculate_weatherlink_crc(u'\xC6\xCE\xA2\x03'))
+		self.assertEqual(0, calculate_weatherlink_crc(b''))
+
+	def test_calculate_crc_in_pieces(self):
+		crc = calculate_weatherlink_crc(b'\xC6')
+		crc = calculate_weatherlink_crc(b'\xCE\xA2', crc)
+		self.assertEqual(0xE2B4, calculate_weatherlink_crc(b'\x03', crc))
+
+	def test_crc_including_crc_resolves_to_zero(self):
+		self.assertEqual(0, calculate_weatherlink_crc(b'\xC6\xCE\xA2\x03\xE2\xB4'))
+		self.assertNotEqual(0, calculate_weatherlink_crc(b'\xC6\xCE\xA2\x03\xE2\xB5'))
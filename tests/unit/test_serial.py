@@ -2,6 +2,7 @@ from __future__ import absolute_import
 
 import io
 import mock
+import socket
 from unittest import TestCase
 
 import six
@@ -163,7 +164,84 @@ class TestSerialCommunicator(TestCase):
 
 class TestSerialIPCommunicator(TestCase):
 	def setUp(self):
-		self.communicator = SerialIPCommunicator('127.0.0.1', 0)  # TODO
+		self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+		self.server.bind(('127.0.0.1', 0, ))
+		self.server.listen(1)
+
+		self.server_port = self.server.getsockname()[1]
+
+		self.communicator = SerialIPCommunicator('127.0.0.1', self.server_port)
+		self.communicator.connect()
+
+		self.console, _ = self.server.accept()
+
+	def tearDown(self):
+		if self.communicator._socket:
+			self.communicator.disconnect()
+		self.console.close()
+		self.server.close()
+
+	def test_connect_twice_fails(self):
+		with self.assertRaises(ValueError):
+			self.communicator.connect()
+
+	def test_disconnect_twice_fails(self):
+		self.communicator.disconnect()
+
+		with self.assertRaises(ValueError):
+			self.communicator.disconnect()
+
+	def test_connect_socket_options(self):
+		self.assertTrue(self.communicator._socket.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY))
+		self.assertTrue(self.communicator._socket.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE))
+		self.assertGreaterEqual(
+			self.communicator._socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF),
+			SerialIPCommunicator.SOCKET_BUFFER_SIZE,
+		)
+
+	def test_connect_failure(self):
+		self.server.close()
+		communicator = SerialIPCommunicator('127.0.0.1', self.server_port)
+
+		with self.assertRaises(socket.error):
+			communicator.connect()
+		self.assertIsNone(communicator._socket)
+
+	def test_send_data(self):
+		self.communicator._send_data(b'EEBRD 2B 01\n')
+
+		self.assertEqual(b'EEBRD 2B 01\n', self.console.recv(100))
+
+	def test_read_data_honors_length(self):
+		self.console.sendall(b'\x06\xF3')
+		self.console.sendall(b'\x14\x5E')
+
+		self.assertEqual(b'\x06', self.communicator._read_data(1))
+		self.assertEqual(b'\xF3\x14\x5E', self.communicator._read_data(3))
+
+	def test_read_data_connection_closed(self):
+		self.console.sendall(b'\x06\xF3')
+		self.console.close()
+
+		with self.assertRaises(IOError):
+			self.communicator._read_data(3)
+
+	def test_confirm_ack_buffers_response(self):
+		self.console.sendall(b'\x06' + b'\xA5' * 16384 + b'\xFF\xE3')
+		self.console.close()
+
+		self.communicator.confirm_ack()
+		# The response arrived with the ACK, so it was taken in by the same read and is served from the buffer
+		self.assertEqual(b'\xA5' * 16384 + b'\xFF\xE3', self.communicator._file_handle.peek(16386)[:16386])
+		self.assertEqual(b'\xA5' * 16384 + b'\xFF\xE3', self.communicator._read_data(16386))
+
+	def test_file_handle_shares_buffer_with_read_data(self):
+		self.console.sendall(b'\x06\xFF\xE3\x03\x41')
+
+		self.assertEqual(b'\x06', self.communicator._read_data(1))
+		with self.communicator._get_file_handle() as handle:
+			self.assertEqual(b'\xFF\xE3\x03\x41', handle.read(4))
+		self.assertFalse(handle.closed)
 
 
 class TestConfigurationSettingMixin(TestCase):
@@ -171,81 +249,258 @@ class TestConfigurationSettingMixin(TestCase):
 	def setUp(self):
 		self.communicator = ConfigurationSettingMixin()
 
+	@staticmethod
+	def _mock_file_handle(*responses):
+		handle = mock.MagicMock(spec=io.BufferedIOBase)
+		handle.read.side_effect = io.BytesIO(b''.join(responses)).read
+		context = mock.MagicMock()
+		context.__enter__.return_value = handle
+		return context
+
+	def _assert_reads(self, mock_get_file_handle, *lengths):
+		self.assertEqual(
+			list(lengths),
+			[c[0][0] for c in mock_get_file_handle.return_value.__enter__.return_value.read.call_args_list],
+		)
+
 	@mock.patch('weatherlink.serial.calculate_weatherlink_crc')
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_instruction')
 	def test_read_config_setting_defaults(self, mock_send_instruction, mock_get_file_handle, mock_crc):
-		mock_get_file_handle.return_value = mock.MagicMock(spec=io.IOBase)
-		mock_get_file_handle.return_value.__enter__.return_value.read.return_value = b'\xFF\xE3\x03\x41'
+		mock_get_file_handle.return_value = self._mock_file_handle(b'\xFF\xE3\x03\x41')
 		mock_crc.return_value = 0
 
 		setting = self.communicator.read_config_setting('3C', '02')
 
 		self.assertEqual(b'\xFF\xE3', setting)
 
-		mock_send_instruction.assert_called_once_with('EEBRD 3C 02\n')
+		mock_send_instruction.assert_called_once_with(b'EEBRD 3C 02\n')
 		mock_get_file_handle.assert_called_once_with()
 		mock_get_file_handle.return_value.__enter__.assert_called_once()
 		mock_get_file_handle.return_value.__exit__.assert_called_once()
-		mock_get_file_handle.return_value.__enter__.return_value.read.assert_called_once_with(4)
-		mock_crc.assert_called_once_with(b'\xFF\xE3\x03\x41')
+		self._assert_reads(mock_get_file_handle, 4)
+		mock_crc.assert_called_once_with(b'\xFF\xE3\x03\x41', 0)
 
 	@mock.patch('weatherlink.serial.calculate_weatherlink_crc')
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_instruction')
 	def test_read_config_setting_return_crc(self, mock_send_instruction, mock_get_file_handle, mock_crc):
-		mock_get_file_handle.return_value = mock.MagicMock(spec=io.IOBase)
-		mock_get_file_handle.return_value.__enter__.return_value.read.return_value = b'\xF3\x14\x5E'
+		mock_get_file_handle.return_value = self._mock_file_handle(b'\xF3\x14\x5E')
 		mock_crc.return_value = 0
 
 		setting = self.communicator.read_config_setting('2F', '01', return_crc=True)
 
 		self.assertEqual(b'\xF3\x14\x5E', setting)
 
-		mock_send_instruction.assert_called_once_with('EEBRD 2F 01\n')
+		mock_send_instruction.assert_called_once_with(b'EEBRD 2F 01\n')
 		mock_get_file_handle.assert_called_once_with()
 		mock_get_file_handle.return_value.__enter__.assert_called_once()
 		mock_get_file_handle.return_value.__exit__.assert_called_once()
-		mock_get_file_handle.return_value.__enter__.return_value.read.assert_called_once_with(3)
-		mock_crc.assert_called_once_with(b'\xF3\x14\x5E')
+		self._assert_reads(mock_get_file_handle, 3)
+		mock_crc.assert_called_once_with(b'\xF3\x14\x5E', 0)
+
+	@mock.patch('weatherlink.serial.calculate_weatherlink_crc')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_instruction')
+	def test_read_config_setting_integer_length(self, mock_send_instruction, mock_get_file_handle, mock_crc):
+		mock_get_file_handle.return_value = self._mock_file_handle(
+			b'\x01\x02\x03\x04\x05\x06\x07',
+			b'\x01\x02\x03\x04\x05\x06\x07',
+		)
+		mock_crc.return_value = 0
+
+		setting = self.communicator.read_config_setting('B1', 5)
+
+		self.assertEqual(b'\x01\x02\x03\x04\x05', setting)
+
+		mock_send_instruction.assert_called_once_with(b'EEBRD B1 05\n')
+		self._assert_reads(mock_get_file_handle, 7)
+
+		mock_send_instruction.reset_mock()
+
+		self.communicator.read_config_setting('B1', '05')
+
+		mock_send_instruction.assert_called_once_with(b'EEBRD B1 05\n')
+		self.assertIs(
+			self.communicator._get_config_read_command('B1', 5),
+			mock_send_instruction.call_args_list[0][0][0],
+		)
+
+	def test_config_read_command_cache_respects_instruction_overrides(self):
+		class LowerCaseConfigurationSettingMixin(ConfigurationSettingMixin):
+			CONFIG_READ_INSTRUCTION = 'eebrd %s %02x\n'
+
+		self.assertEqual(b'EEBRD 1A 0A\n', ConfigurationSettingMixin._get_config_read_command('1A', 10))
+		self.assertEqual(b'eebrd 1A 0a\n', LowerCaseConfigurationSettingMixin._get_config_read_command('1A', 10))
+
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._config_read_commands', {})
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.CONFIG_READ_COMMAND_CACHE_SIZE', 2)
+	def test_config_read_command_cache_is_bounded(self):
+		for address in ('01', '02', '03', '04', ):
+			self.assertEqual(
+				('EEBRD %s 01\n' % address).encode('ascii'),
+				ConfigurationSettingMixin._get_config_read_command(address, 1),
+			)
+
+		self.assertEqual(2, len(ConfigurationSettingMixin._config_read_commands))
 
 	@mock.patch('weatherlink.serial.calculate_weatherlink_crc')
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_instruction')
 	def test_read_config_setting_crc_fails(self, mock_send_instruction, mock_get_file_handle, mock_crc):
-		mock_get_file_handle.return_value = mock.MagicMock(spec=io.IOBase)
-		mock_get_file_handle.return_value.__enter__.return_value.read.return_value = b'\xFF\xE3\x03\x41'
+		mock_get_file_handle.return_value = self._mock_file_handle(b'\xFF\xE3\x03\x41')
 		mock_crc.return_value = 123489
 
 		with self.assertRaises(CRCValidationError):
 			self.communicator.read_config_setting('3C', '02')
 
-		mock_send_instruction.assert_called_once_with('EEBRD 3C 02\n')
+		mock_send_instruction.assert_called_once_with(b'EEBRD 3C 02\n')
 		mock_get_file_handle.assert_called_once_with()
 		mock_get_file_handle.return_value.__enter__.assert_called_once()
 		mock_get_file_handle.return_value.__exit__.assert_called_once()
-		mock_get_file_handle.return_value.__enter__.return_value.read.assert_called_once_with(4)
-		mock_crc.assert_called_once_with(b'\xFF\xE3\x03\x41')
+		self._assert_reads(mock_get_file_handle, 4)
+		mock_crc.assert_called_once_with(b'\xFF\xE3\x03\x41', 0)
 
 	@mock.patch('weatherlink.serial.calculate_weatherlink_crc')
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_instruction')
 	def test_read_config_setting_crc_ignored(self, mock_send_instruction, mock_get_file_handle, mock_crc):
-		mock_get_file_handle.return_value = mock.MagicMock(spec=io.IOBase)
-		mock_get_file_handle.return_value.__enter__.return_value.read.return_value = b'\xF3\x14\x5E'
+		mock_get_file_handle.return_value = self._mock_file_handle(b'\xF3\x14\x5E')
 		mock_crc.return_value = 123489
 
 		setting = self.communicator.read_config_setting('2F', '01', confirm_crc=False)
 
 		self.assertEqual(b'\xF3', setting)
 
-		mock_send_instruction.assert_called_once_with('EEBRD 2F 01\n')
+		mock_send_instruction.assert_called_once_with(b'EEBRD 2F 01\n')
 		mock_get_file_handle.assert_called_once_with()
 		mock_get_file_handle.return_value.__enter__.assert_called_once()
 		mock_get_file_handle.return_value.__exit__.assert_called_once()
-		mock_get_file_handle.return_value.__enter__.return_value.read.assert_called_once_with(3)
+		self._assert_reads(mock_get_file_handle, 3)
 		self.assertFalse(mock_crc.called)
 
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.CONFIG_READ_CHUNK_SIZE', 2)
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_instruction')
+	def test_read_config_setting_in_chunks(self, mock_send_instruction, mock_get_file_handle):
+		mock_get_file_handle.return_value = self._mock_file_handle(b'\xC6\xCE\xA2\x03\xE2\xB4')
+
+		setting = self.communicator.read_config_setting('3C', 4)
+
+		self.assertEqual(b'\xC6\xCE\xA2\x03', setting)
+		self._assert_reads(mock_get_file_handle, 2, 2, 2)
+
+		mock_get_file_handle.return_value = self._mock_file_handle(b'\xC6\xCE\xA2\x03\xE2\xB5')
+
+		with self.assertRaises(CRCValidationError):
+			self.communicator.read_config_setting('3C', 4)
+
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_instruction')
+	def test_read_config_setting_connection_closed(self, mock_send_instruction, mock_get_file_handle):
+		mock_get_file_handle.return_value = self._mock_file_handle(b'\xC6\xCE\xA2')
+
+		with self.assertRaises(IOError):
+			self.communicator.read_config_setting('3C', 4)
+
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.CONFIG_READ_BATCH_SIZE', 2)
+	@mock.patch('weatherlink.serial.calculate_weatherlink_crc')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.confirm_ack')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_data')
+	def test_read_config_settings_batch(self, mock_send_data, mock_confirm_ack, mock_get_file_handle, mock_crc):
+		mock_get_file_handle.return_value = self._mock_file_handle(
+			b'\xFF\xE3\x03\x41',
+			b'\xF3\x14\x5E',
+			b'\x2A\x00\x01\x7B\x10',
+		)
+		mock_crc.return_value = 0
+
+		settings = self.communicator.read_config_settings_batch([('3C', '02'), ('2F', 1), ('41', 3)])
+
+		self.assertEqual([b'\xFF\xE3', b'\xF3', b'\x2A\x00\x01'], settings)
+
+		self.assertEqual(
+			[mock.call(b'EEBRD 3C 02\nEEBRD 2F 01\n'), mock.call(b'EEBRD 41 03\n')],
+			mock_send_data.call_args_list,
+		)
+		self.assertEqual(3, mock_confirm_ack.call_count)
+		self._assert_reads(mock_get_file_handle, 4, 3, 5)
+		self.assertEqual(3, mock_crc.call_count)
+
+	@mock.patch('weatherlink.serial.calculate_weatherlink_crc')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.confirm_ack')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_data')
+	def test_read_config_settings_batch_crc_fails(
+		self,
+		mock_send_data,
+		mock_confirm_ack,
+		mock_get_file_handle,
+		mock_crc,
+	):
+		mock_get_file_handle.return_value = self._mock_file_handle(
+			b'\xFF\xE3\x03\x41',
+			b'\xF3\x14\x5E',
+		)
+		mock_crc.side_effect = [0, 123489]
+
+		with self.assertRaises(CRCValidationError):
+			self.communicator.read_config_settings_batch([('3C', '02'), ('2F', '01')])
+
+		mock_send_data.assert_called_once_with(b'EEBRD 3C 02\nEEBRD 2F 01\n')
+		self.assertEqual(2, mock_confirm_ack.call_count)
+
+	@mock.patch('weatherlink.serial.calculate_weatherlink_crc')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.confirm_ack')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_data')
+	def test_read_config_setting_after_batch_crc_fails(
+		self,
+		mock_send_data,
+		mock_confirm_ack,
+		mock_get_file_handle,
+		mock_crc,
+	):
+		mock_get_file_handle.return_value = self._mock_file_handle(
+			b'\xFF\xE3\x03\x41',
+			b'\xF3\x14\x5E',
+			b'\x2A\x00\x01\x7B\x10',
+			b'\x77\x9C\x21',
+		)
+		mock_crc.side_effect = [123489, 0]
+
+		with self.assertRaises(CRCValidationError):
+			self.communicator.read_config_settings_batch([('3C', '02'), ('2F', 1), ('41', 3)])
+
+		self.assertEqual(b'\x77', self.communicator.read_config_setting('2A', 1))
+		self._assert_reads(mock_get_file_handle, 4, 3, 5, 3)
+		self.assertEqual(4, mock_confirm_ack.call_count)
+
+	@mock.patch('weatherlink.serial.calculate_weatherlink_crc')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._get_file_handle')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.confirm_ack')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_data')
+	def test_read_config_setting_after_batch_not_acknowledged(
+		self,
+		mock_send_data,
+		mock_confirm_ack,
+		mock_get_file_handle,
+		mock_crc,
+	):
+		mock_get_file_handle.return_value = self._mock_file_handle(
+			b'\x2A\x00\x01\x7B\x10',
+			b'\x77\x9C\x21',
+		)
+		mock_confirm_ack.side_effect = [NotAcknowledgedError(), NotAcknowledgedError(), None, None]
+		mock_crc.return_value = 0
+
+		with self.assertRaises(NotAcknowledgedError):
+			self.communicator.read_config_settings_batch([('3C', '02'), ('2F', 1), ('41', 3)])
+
+		self.assertEqual(b'\x77', self.communicator.read_config_setting('2A', 1))
+		self._assert_reads(mock_get_file_handle, 5, 3)
+
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.read_config_setting')
 	def test_read_setup_bit(self, mock_read_config_setting):
 		mock_read_config_setting.return_value = six.int2byte(0b10101110)
@@ -253,7 +508,7 @@ class TestConfigurationSettingMixin(TestCase):
 		bit = self.communicator.read_setup_bit(0b10)
 
 		self.assertEqual(0b10, bit)
-		mock_read_config_setting.assert_called_once_with('2B', '01')
+		mock_read_config_setting.assert_called_once_with('2B', 1)
 
 		mock_read_config_setting.reset_mock()
 
@@ -262,7 +517,7 @@ class TestConfigurationSettingMixin(TestCase):
 		bit = self.communicator.read_setup_bit(0b10)
 
 		self.assertEqual(0b00, bit)
-		mock_read_config_setting.assert_called_once_with('2B', '01')
+		mock_read_config_setting.assert_called_once_with('2B', 1)
 
 		mock_read_config_setting.reset_mock()
 
@@ -271,7 +526,7 @@ class TestConfigurationSettingMixin(TestCase):
 		bit = self.communicator.read_setup_bit(0b110)
 
 		self.assertEqual(0b100, bit)
-		mock_read_config_setting.assert_called_once_with('2B', '01')
+		mock_read_config_setting.assert_called_once_with('2B', 1)
 
 		mock_read_config_setting.reset_mock()
 
@@ -280,7 +535,7 @@ class TestConfigurationSettingMixin(TestCase):
 		bit = self.communicator.read_setup_bit(0b110)
 
 		self.assertEqual(0b110, bit)
-		mock_read_config_setting.assert_called_once_with('2B', '01')
+		mock_read_config_setting.assert_called_once_with('2B', 1)
 
 	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.read_config_setting')
 	def test_read_rain_collector_type(self, mock_read_config_setting):
@@ -289,22 +544,101 @@ class TestConfigurationSettingMixin(TestCase):
 		collector_type = RainCollectorTypeSerial(self.communicator.read_rain_collector_type())
 
 		self.assertEqual(RainCollectorTypeSerial.millimeters_0_1, collector_type)
-		mock_read_config_setting.assert_called_once_with('2B', '01')
+		mock_read_config_setting.assert_called_once_with('2B', 1)
 
 		mock_read_config_setting.reset_mock()
+		self.communicator._rain_collector_type = None
 
 		mock_read_config_setting.return_value = six.int2byte(0b10011110)
 
 		collector_type = RainCollectorTypeSerial(self.communicator.read_rain_collector_type())
 
 		self.assertEqual(RainCollectorTypeSerial.millimeters_0_2, collector_type)
-		mock_read_config_setting.assert_called_once_with('2B', '01')
+		mock_read_config_setting.assert_called_once_with('2B', 1)
 
 		mock_read_config_setting.reset_mock()
+		self.communicator._rain_collector_type = None
 
 		mock_read_config_setting.return_value = six.int2byte(0b10001110)
 
 		collector_type = RainCollectorTypeSerial(self.communicator.read_rain_collector_type())
 
 		self.assertEqual(RainCollectorTypeSerial.inches_0_01, collector_type)
-		mock_read_config_setting.assert_called_once_with('2B', '01')
+		mock_read_config_setting.assert_called_once_with('2B', 1)
+
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.read_config_setting')
+	def test_read_setup_bits_all(self, mock_read_config_setting):
+		mock_read_config_setting.return_value = six.int2byte(0b10101110)
+
+		bits = self.communicator.read_setup_bits_all()
+
+		self.assertEqual(
+			{
+				'time_mode_24_hour': 0b0,
+				'is_am': 0b10,
+				'day_month_format': 0b100,
+				'wind_cup_large': 0b1000,
+				'rain_collector': 0b100000,
+				'latitude_north': 0b0,
+				'longitude_east': 0b10000000,
+			},
+			bits,
+		)
+		mock_read_config_setting.assert_called_once_with('2B', 1)
+
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_data')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_instruction')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.read_config_setting')
+	def test_read_rain_collector_type_cached(self, mock_read_config_setting, mock_send_instruction, mock_send_data):
+		mock_read_config_setting.return_value = six.int2byte(0b10101110)
+
+		self.assertEqual(RainCollectorTypeSerial.millimeters_0_1.value, self.communicator.read_rain_collector_type())
+		self.assertEqual(RainCollectorTypeSerial.millimeters_0_1.value, self.communicator.read_rain_collector_type())
+		mock_read_config_setting.assert_called_once_with('2B', 1)
+
+		mock_read_config_setting.reset_mock()
+
+		self.communicator.write_config_setting('2b', 1, six.int2byte(0b10011110))
+		mock_send_instruction.assert_called_once_with(b'EEBWR 2b 01\n')
+		self.assertEqual(1, mock_send_data.call_count)
+
+		mock_read_config_setting.return_value = six.int2byte(0b10011110)
+
+		self.assertEqual(RainCollectorTypeSerial.millimeters_0_2.value, self.communicator.read_rain_collector_type())
+		mock_read_config_setting.assert_called_once_with('2B', 1)
+
+	@mock.patch('weatherlink.serial.SerialCommunicator.disconnect')
+	@mock.patch('weatherlink.serial.SerialCommunicator.connect')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin.read_config_setting')
+	def test_read_rain_collector_type_read_again_after_reconnect(
+		self,
+		mock_read_config_setting,
+		mock_connect,
+		mock_disconnect,
+	):
+		mock_read_config_setting.return_value = six.int2byte(0b10101110)
+
+		self.communicator.connect()
+		self.assertEqual(RainCollectorTypeSerial.millimeters_0_1.value, self.communicator.read_rain_collector_type())
+		self.communicator.disconnect()
+
+		mock_read_config_setting.return_value = six.int2byte(0b10011110)
+
+		self.communicator.connect()
+		self.assertEqual(RainCollectorTypeSerial.millimeters_0_2.value, self.communicator.read_rain_collector_type())
+		self.communicator.disconnect()
+
+		self.assertEqual(2, mock_read_config_setting.call_count)
+		self.assertEqual(2, mock_connect.call_count)
+		self.assertEqual(2, mock_disconnect.call_count)
+
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_data')
+	@mock.patch('weatherlink.serial.ConfigurationSettingMixin._send_instruction')
+	def test_write_config_setting_clears_rain_collector_cache_when_covered(self, mock_send_instruction, mock_send_data):
+		self.communicator._rain_collector_type = RainCollectorTypeSerial.millimeters_0_1.value
+		self.communicator.write_config_setting('2C', 1, b'\x00')
+		self.communicator.write_config_setting('29', 2, b'\x00\x00')
+		self.assertEqual(RainCollectorTypeSerial.millimeters_0_1.value, self.communicator._rain_collector_type)
+
+		self.communicator.write_config_setting('2A', 2, b'\x00\x00')
+		self.assertIsNone(self.communicator._rain_collector_type)
@@ -1,8 +1,10 @@
 from __future__ import absolute_import
 
 from datetime import datetime
+import decimal
 from decimal import Decimal
 import imp
+import mock
 import os
 from unittest import (
 	skip,
@@ -12,6 +14,19 @@ from unittest import (
 from weatherlink import utils
 
 
+class TestAsDecimal(TestCase):
+	def test_as_decimal(self):
+		value = Decimal('3.5')
+		self.assertIs(value, utils._as_decimal(value))
+		self.assertEqual(Decimal('0'), utils._as_decimal(None))
+		self.assertEqual(Decimal('0'), utils._as_decimal(0))
+		self.assertEqual(Decimal('5'), utils._as_decimal(5))
+		self.assertEqual(Decimal('-100'), utils._as_decimal(-100))
+		self.assertEqual(Decimal('250'), utils._as_decimal(250))
+		self.assertEqual(Decimal('2.5'), utils._as_decimal(2.5))
+		self.assertIsInstance(utils._as_decimal(5), Decimal)
+
+
 class TestUnitConversion(TestCase):
 	def test_convert_fahrenheit_to_kelvin(self):
 		self.assertEqual(Decimal('255.372'), utils.convert_fahrenheit_to_kelvin(0))
@@ -305,8 +320,62 @@ class TestIndexCalculation(TestCase):
 		self.assertAlmostEqual(Decimal('55.4'), utils.calculate_dew_point(Decimal('55.7'), Decimal('99')), delta=0.1)
 		self.assertAlmostEqual(Decimal('34.7'), utils.calculate_dew_point(Decimal('55.7'), Decimal('45')), delta=0.1)
 
+	def test_floating_point_calculations_return_decimals(self):
+		self.assertEqual(Decimal('64.3'), utils.calculate_dew_point(83, 54))
+		self.assertIsInstance(utils.calculate_dew_point(Decimal('83.1'), Decimal('54')), Decimal)
+		self.assertIsInstance(utils.calculate_wet_bulb_temperature(Decimal('84.4'), 50, Decimal('29.80')), Decimal)
+		self.assertIsInstance(utils.calculate_wind_chill(Decimal('20.0'), Decimal('15')), Decimal)
+		self.assertIsInstance(utils.calculate_thsw_index(Decimal('84.4'), 50, 800, Decimal('3')), Decimal)
+		self.assertEqual(Decimal('20.0'), utils.calculate_wind_chill(Decimal('20.0'), 0))
+
+	def test_invalid_inputs_raise_invalid_operation(self):
+		with self.assertRaises(decimal.InvalidOperation):
+			utils.calculate_dew_point(Decimal('50'), 0)
+		with self.assertRaises(decimal.InvalidOperation):
+			utils.calculate_dew_point(Decimal('50'), Decimal('-5'))
+		with self.assertRaises(decimal.InvalidOperation):
+			utils.calculate_wind_chill(Decimal('20'), Decimal('-5'))
+
+	def test_calculations_do_not_depend_on_earlier_calls(self):
+		self.assertEqual(30, utils.calculate_wind_chill(30, 0))
+		self.assertIsInstance(utils.calculate_wind_chill(Decimal('30.0'), 0), Decimal)
+
+		self.assertEqual(35.5, utils.calculate_wind_chill(35.5, 1))
+		self.assertIsInstance(utils.calculate_wind_chill(Decimal('35.5'), 1), Decimal)
+
+		self.assertEqual((0, (3, 0, ), 0, ), utils.calculate_wind_chill(Decimal('30'), 0).as_tuple())
+		self.assertEqual((0, (3, 0, 0, 0, ), -2, ), utils.calculate_wind_chill(Decimal('30.00'), 0).as_tuple())
+
+		with decimal.localcontext() as context:
+			context.prec = 2
+			with self.assertRaises(decimal.InvalidOperation):
+				utils.calculate_heat_index(Decimal('96.0'), Decimal('10'))
+		self.assertEqual(Decimal('90.4'), utils.calculate_heat_index(Decimal('96.0'), Decimal('10')))
+
+	def test_calculate_thsw_indexes_matches_calculate_thsw_index(self):
+		temperatures = (Decimal('91.5'), Decimal('92.0'), Decimal('90.8'), )
+		solar_radiations = (Decimal('812'), Decimal('845'), )
+		wind_speeds = (Decimal('3'), 0, )
+
+		self.assertEqual(
+			[
+				utils.calculate_thsw_index(T, Decimal('45'), S, W)
+				for S in solar_radiations for T in temperatures for W in wind_speeds
+			],
+			utils._calculate_thsw_indexes(temperatures, Decimal('45'), solar_radiations, wind_speeds),
+		)
+
 	def test_calculate_thw_index(self):
 		self.assertIsNone(utils.calculate_thw_index(Decimal('69.9'), Decimal('90'), Decimal('5')))
+		self.assertIsNone(utils.calculate_thw_index(Decimal('69.9'), Decimal('90'), 0))
+		self.assertEqual(
+			utils.calculate_heat_index(Decimal('90'), Decimal('60')),
+			utils.calculate_thw_index(Decimal('90'), Decimal('60'), 0),
+		)
+		self.assertEqual(
+			utils.calculate_heat_index(Decimal('90'), Decimal('60')) - Decimal('5.4'),
+			utils.calculate_thw_index(Decimal('90'), Decimal('60'), Decimal('5')),
+		)
 		# TODO: More assertions
 
 	@skip('This calculation is not complete.')
@@ -331,6 +400,122 @@ class TestIndexCalculation(TestCase):
 		self.assertEqual(Decimal('55'), utils.calculate_heating_degree_days(Decimal('10')))
 
 
+class TestAllRecordValuesCalculation(TestCase):
+	RECORDS = (
+		{
+			'minutes_covered': 5,
+			'wind_speed': Decimal('3'),
+			'wind_speed_high': Decimal('9'),
+			'humidity_outside': Decimal('45'),
+			'humidity_inside': Decimal('38'),
+			'barometric_pressure': Decimal('30.01'),
+			'temperature_outside': Decimal('91.5'),
+			'temperature_outside_low': Decimal('90.8'),
+			'temperature_outside_high': Decimal('92.0'),
+			'temperature_inside': Decimal('72.4'),
+			'solar_radiation': Decimal('812'),
+			'solar_radiation_high': Decimal('845'),
+		},
+		{
+			'minutes_covered': 5,
+			'wind_speed': Decimal('0'),
+			'wind_speed_high': Decimal('4'),
+			'humidity_outside': Decimal('81'),
+			'barometric_pressure': Decimal('29.41'),
+			'temperature_outside': Decimal('28.1'),
+			'temperature_outside_low': Decimal('27.9'),
+			'temperature_outside_high': Decimal('41.0'),
+		},
+		{
+			'minutes_covered': 1,
+			'wind_speed': None,
+			'humidity_outside': Decimal('91.5'),
+			'barometric_pressure': None,
+			'temperature_outside': Decimal('-12.6'),
+		},
+		{
+			'minutes_covered': 5,
+		},
+		{
+			'minutes_covered': 5,
+			'wind_speed': Decimal('5'),
+			'wind_speed_high': Decimal('12'),
+			'humidity_outside': Decimal('70'),
+			'barometric_pressure': Decimal('30.10'),
+			'temperature_outside': Decimal('0.0'),
+			'temperature_outside_low': Decimal('-1.2'),
+			'temperature_outside_high': Decimal('0.4'),
+		},
+	)
+
+	def test_calculate_all_record_values(self):
+		values = utils.calculate_all_record_values(self.RECORDS[0])
+
+		self.assertEqual(Decimal('0.25'), values['wind_run_distance_total'])
+		self.assertEqual(utils.calculate_dew_point(Decimal('91.5'), Decimal('45')), values['dew_point_outside'])
+		self.assertEqual(utils.calculate_dew_point(Decimal('90.8'), Decimal('45')), values['dew_point_outside_low'])
+		self.assertEqual(utils.calculate_dew_point(Decimal('92.0'), Decimal('45')), values['dew_point_outside_high'])
+		self.assertNotIn('wind_chill', values)
+		self.assertEqual(
+			utils.calculate_thsw_index(Decimal('91.5'), Decimal('45'), Decimal('812'), Decimal('3')),
+			values['thsw_index'],
+		)
+		self.assertEqual(
+			utils.calculate_thsw_index(Decimal('90.8'), Decimal('45'), Decimal('812'), Decimal('9')),
+			values['thsw_index_low'],
+		)
+		self.assertEqual(
+			utils.calculate_thsw_index(Decimal('92.0'), Decimal('45'), Decimal('845'), Decimal('3')),
+			values['thsw_index_high'],
+		)
+
+		self.assertEqual({}, utils.calculate_all_record_values(self.RECORDS[3]))
+
+	def test_calculate_all_record_values_equal_low_and_high(self):
+		values = utils.calculate_all_record_values({
+			'minutes_covered': 1,
+			'wind_speed': Decimal('4'),
+			'wind_speed_high': Decimal('4'),
+			'humidity_outside': Decimal('62'),
+			'barometric_pressure': Decimal('29.95'),
+			'temperature_outside': Decimal('85.2'),
+			'temperature_outside_low': Decimal('85.2'),
+			'temperature_outside_high': Decimal('85.2'),
+			'solar_radiation': Decimal('640'),
+			'solar_radiation_high': Decimal('640'),
+		})
+
+		for name in ('temperature_wet_bulb', 'dew_point_outside', 'heat_index_outside', 'thw_index', 'thsw_index', ):
+			self.assertIsNotNone(values[name])
+			self.assertEqual(values[name], values[name + '_low'])
+			self.assertEqual(values[name], values[name + '_high'])
+
+	def test_calculate_all_record_values_zero_temperature(self):
+		values = utils.calculate_all_record_values(self.RECORDS[4])
+
+		self.assertEqual(
+			utils.calculate_wet_bulb_temperature(Decimal('0.0'), Decimal('70'), Decimal('30.10')),
+			values['temperature_wet_bulb'],
+		)
+		self.assertEqual(utils.calculate_dew_point(Decimal('0.0'), Decimal('70')), values['dew_point_outside'])
+		self.assertEqual(utils.calculate_wind_chill(Decimal('0.0'), Decimal('5')), values['wind_chill'])
+		self.assertEqual(utils.calculate_wind_chill(Decimal('-1.2'), Decimal('12')), values['wind_chill_low'])
+
+	def test_calculate_all_record_values_batch(self):
+		self.assertEqual(
+			[utils.calculate_all_record_values(record) for record in self.RECORDS],
+			utils.calculate_all_record_values_batch(self.RECORDS),
+		)
+		self.assertEqual([], utils.calculate_all_record_values_batch([]))
+
+	def test_calculate_all_record_values_batch_without_numpy(self):
+		with mock.patch('weatherlink.utils.numpy', None):
+			self.assertEqual(
+				[utils.calculate_all_record_values(record) for record in self.RECORDS],
+				utils.calculate_all_record_values_batch(iter(self.RECORDS)),
+			)
+
+
 class TestHighTenMinuteWindAverageCalculation(TestCase):
 
 	def test_bogus_inputs_yield_empty_results(self):
@@ -442,6 +627,21 @@ class TestHighTenMinuteWindAverageCalculation(TestCase):
 		self.assertEqual(start, datetime(2016, 4, 27, 12, 36))
 		self.assertEqual(end, datetime(2016, 4, 27, 12, 45))
 
+	def test_negative_minutes_covered_are_ignored(self):
+		avg, direction, start, end = utils.calculate_10_minute_wind_average(
+			[
+				(9, 'S', datetime(2016, 4, 29, 6, 5), -1, ),
+				(8, 'N', datetime(2016, 4, 29, 6, 10), 5, ),
+				(8, 'N', datetime(2016, 4, 29, 6, 15), 5, ),
+				(8, 'N', datetime(2016, 4, 29, 6, 20), 5, ),
+			]
+		)
+
+		self.assertEqual(Decimal('8'), avg)
+		self.assertEqual('N', direction)
+		self.assertEqual(start, datetime(2016, 4, 29, 6, 6))
+		self.assertEqual(end, datetime(2016, 4, 29, 6, 15))
+
 	def test_record_period_change(self):
 		avg, direction, start, end = utils.calculate_10_minute_wind_average(
 			[
@@ -1,6 +1,7 @@
 from __future__ import absolute_import
 
 import collections
+import io
 
 from weatherlink.models import (
 	Header,
@@ -8,6 +9,22 @@ from weatherlink.models import (
 	ArchiveIntervalRecord,
 )
 
+try:
+	import numpy
+except ImportError:  # NumPy is optional and only needed for `Importer.daily_records_array`
+	numpy = None
+
+
+if numpy:
+	RECORD_DTYPE_WLK = numpy.dtype({
+		'names': [f[0] for f in ArchiveIntervalRecord.RECORD_ARRAY_FIELDS_WLK],
+		'formats': [f[1] for f in ArchiveIntervalRecord.RECORD_ARRAY_FIELDS_WLK],
+		'offsets': [f[2] for f in ArchiveIntervalRecord.RECORD_ARRAY_FIELDS_WLK],
+		'itemsize': ArchiveIntervalRecord.RECORD_LENGTH_WLK,
+	})
+else:
+	RECORD_DTYPE_WLK = None
+
 
 class Importer(object):
 	FILE_EXTENSION = '.wlk'
@@ -32,6 +49,7 @@ class Importer(object):
 		self.daily_summaries = None
 		self.records = None
 		self.daily_records = None
+		self.daily_records_array = None
 
 	def import_data(self):
 		with open(self.file_name, 'rb') as file_handle:
@@ -39,21 +57,30 @@ class Importer(object):
 			self.daily_summaries = {}
 			self.records = []
 			self.daily_records = collections.defaultdict(list)
+			# Maps each day to a NumPy structured array of its raw records (RECORD_DTYPE_WLK), if NumPy is installed
+			self.daily_records_array = {} if numpy else None
 
 			for day, day_index in enumerate(self.header.day_indexes):
-				if day > 0:
-					for r in range(0, day_index.record_count - 1):
-						if r == 0:
-							self.daily_summaries[day] = DailySummary.load_from_wlk(
-								file_handle,
-								self.year,
-								self.month,
-								day,
-							)
-						else:
-							record = ArchiveIntervalRecord.load_from_wlk(file_handle, self.year, self.month, day)
-							self.records.append(record)
-							self.daily_records[day].append(record)
+				# The daily summary takes up the first two record slots of each day that has any records
+				if day > 0 and day_index.record_count > 1:
+					self.daily_summaries[day] = DailySummary.load_from_wlk(
+						file_handle,
+						self.year,
+						self.month,
+						day,
+					)
+
+					# Read the day's records in a single block, which is also the source of the structured array
+					record_count = day_index.record_count - 2
+					block = file_handle.read(ArchiveIntervalRecord.RECORD_LENGTH_WLK * record_count)
+					block_handle = io.BytesIO(block)
+					for _ in range(0, record_count):
+						record = ArchiveIntervalRecord.load_from_wlk(block_handle, self.year, self.month, day)
+						self.records.append(record)
+						self.daily_records[day].append(record)
+
+					if numpy:
+						self.daily_records_array[day] = numpy.frombuffer(block, dtype=RECORD_DTYPE_WLK, count=record_count)
 
 			# print(f"header: {self.header}")
 			# print(f"daily_records: {self.daily_records}")
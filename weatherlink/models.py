@@ -158,17 +158,20 @@ RainCollectorTypeDatabase.millimeters_0_1.clicks_to_centimeters = lambda c: c *
 
 
 class RecordDict(dict):
+	# Values live in the dict itself, so records need no instance __dict__ (subclasses must also declare __slots__)
+	__slots__ = ()
+
 	def __init__(self, *args, **kwargs):
 		super(RecordDict, self).__init__(*args, **kwargs)
 
-	def __getattr__(self, name):
-		return self.__getitem__(name)
-
-	def __setattr__(self, name, value):
-		self[name] = value
+	# Bound directly to the dict methods so that attribute access doesn't go through an extra Python-level call
+	__getattr__ = dict.__getitem__
+	__setattr__ = dict.__setitem__
 
 
 class Header(RecordDict):
+	__slots__ = ()
+
 	VERSION_CODE_AND_COUNT_FORMAT = '=16sl'
 	VERSION_CODE_AND_COUNT_LENGTH = 20
 
@@ -193,6 +196,8 @@ class Header(RecordDict):
 
 
 class DayIndex(RecordDict):
+	__slots__ = ()
+
 	DAY_INDEX_FORMAT = '=hl'
 	DAY_INDEX_LENGTH = 6
 
@@ -210,6 +215,8 @@ class DayIndex(RecordDict):
 
 
 class DailySummary(RecordDict):
+	__slots__ = ()
+
 	DAILY_SUMMARY_FORMAT = (
 		'=bx'  # '2' plus a reserved byte [ignored]
 		'h'  # number of minutes accounted for in this day's records
@@ -330,6 +337,8 @@ class DailySummary(RecordDict):
 
 
 class ArchiveIntervalRecord(RecordDict):
+	__slots__ = ()
+
 	RECORD_FORMAT_WLK = (
 		'=b'  # '1'
 		'b'  # minutes in this record
@@ -382,6 +391,31 @@ class ArchiveIntervalRecord(RecordDict):
 	)
 	RECORD_LENGTH_WLK = 88
 	RECORD_LENGTH_DOWNLOAD = 52
+	# The raw fields of RECORD_FORMAT_WLK as (name, NumPy type code, byte offset), for reading whole blocks of records
+	# into structured arrays; values are undecoded, so scale factors and dash values still apply
+	RECORD_ARRAY_FIELDS_WLK = (
+		('record_type', 'i1', 0, ),
+		('minutes_covered', 'i1', 1, ),
+		('minutes_past_midnight', '<i2', 4, ),
+		('temperature_outside', '<i2', 6, ),
+		('temperature_outside_high', '<i2', 8, ),
+		('temperature_outside_low', '<i2', 10, ),
+		('temperature_inside', '<i2', 12, ),
+		('barometric_pressure', '<i2', 14, ),
+		('humidity_outside', '<i2', 16, ),
+		('humidity_inside', '<i2', 18, ),
+		('rain_code', '<u2', 20, ),
+		('rain_rate_clicks', '<i2', 22, ),
+		('wind_speed', '<i2', 24, ),
+		('wind_speed_high', '<i2', 26, ),
+		('wind_direction_prevailing', 'u1', 28, ),
+		('wind_direction_speed_high', 'u1', 29, ),
+		('number_of_wind_samples', '<i2', 30, ),
+		('solar_radiation', '<i2', 32, ),
+		('solar_radiation_high', '<i2', 34, ),
+		('uv_index', 'u1', 36, ),
+		('uv_index_high', 'u1', 37, ),
+	)
 	RECORD_VERIFICATION_MAP_WLK = {
 		0: 1,
 	}
@@ -545,6 +579,8 @@ class ArchiveIntervalRecord(RecordDict):
 
 
 class LoopRecord(RecordDict):
+	__slots__ = ()
+
 	RECORD_LENGTH = 99
 
 	LOOP1_RECORD_TYPE = 0
@@ -779,11 +815,26 @@ WEATHERLINK_CRC_TABLE = (
 )
 
 
-def calculate_weatherlink_crc(data_bytes):
-	crc = 0
-	cast_with_ord = isinstance(data_bytes, six.string_types)
-	for i, byte in enumerate(data_bytes):
-		if cast_with_ord:
-			byte = ord(byte)
-		crc = WEATHERLINK_CRC_TABLE[((crc >> 8) & 0xFF) ^ byte] ^ ((crc << 8) & 0xFF00)
+def calculate_weatherlink_crc(data_bytes, crc=0):
+	"""
+	Calculates the CRC-CCITT checksum that the WeatherLink protocol uses to validate data. Passing in the result of a
+	previous call as `crc` continues that calculation, so that data can be checked in pieces as it arrives. Data that
+	ends with its own (big-endian) CRC yields 0.
+
+	:param data_bytes: The data to checksum
+	:type data_bytes: str | bytes | bytearray
+	:param crc: The CRC of the data preceding `data_bytes`, if any (defaults to 0)
+	:type crc: int
+
+	:return: The CRC
+	:rtype: int
+	"""
+	if isinstance(data_bytes, six.string_types):
+		# Strings iterate as characters, but a bytearray iterates as ints, so convert once instead of per byte
+		data_bytes = bytearray(data_bytes) if isinstance(data_bytes, bytes) else bytearray(ord(c) for c in data_bytes)
+
+	table = WEATHERLINK_CRC_TABLE
+	for byte in data_bytes:
+		# crc never exceeds 16 bits, so crc >> 8 is already the high byte
+		crc = table[(crc >> 8) ^ byte] ^ ((crc << 8) & 0xFF00)
 	return crc
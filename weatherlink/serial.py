@@ -7,15 +7,19 @@ from __future__ import absolute_import
 
 import abc
 import contextlib
-import curses.ascii
 import socket
 import struct
+import sys
 
 import six
 
 from weatherlink.models import calculate_weatherlink_crc
 
 
+ACK = 0x06
+NAK = 0x15
+
+
 if six.binary_type == str:
 	# Values returned by binary file reading are plain strings, binary chars are plain strings in Python 2
 	def char_to_byte(char):
@@ -36,14 +40,14 @@ class NotAcknowledgedError(AcknowledgmentError):
 	@classmethod
 	def raise_if_not_acknowledged(cls, ack):
 		ack = char_to_byte(ack)
-		if ack == curses.ascii.NAK or ack == cls.NAK_BYTE:
+		if ack == NAK or ack == cls.NAK_BYTE:
 			raise cls('Request not acknowledged by weather console')
 
 
 class InvalidAcknowledgementError(AcknowledgmentError):
 	@classmethod
 	def raise_if_not_acknowledged(cls, ack):
-		if char_to_byte(ack) != curses.ascii.ACK:
+		if char_to_byte(ack) != ACK:
 			raise cls('Expected ACK response 0x06, received %s instead.' % ack)
 
 
@@ -177,6 +181,9 @@ class SerialCommunicator(object):
 class SerialIPCommunicator(SerialCommunicator):
 	DEFAULT_PORT_NUMBER = 22222
 
+	# Kernel and read buffer sizes for the connection, so that large settings reads don't stall on small buffers
+	SOCKET_BUFFER_SIZE = 64 * 1024
+
 	def __init__(self, host, port, *args, **kwargs):
 		super(SerialIPCommunicator, self).__init__(*args, **kwargs)
 
@@ -184,14 +191,22 @@ class SerialIPCommunicator(SerialCommunicator):
 		self.port = port
 
 		self._socket = None
+		self._file_handle = None
 
 	def connect(self):
 		if self._socket:
 			raise ValueError('Cannot connect when already connected.')
 
 		try:
-			self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-			self._socket.connect((self.host, self.port, ))
+			self._socket = socket.create_connection((self.host, self.port, ))
+			# Instructions and ACKs are tiny, and each waits on the other, so they must not be held back by Nagle
+			self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+			self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+			self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.SOCKET_BUFFER_SIZE)
+			self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self.SOCKET_BUFFER_SIZE)
+			# All reads go through this one buffered handle so that small reads don't each cost a recv system call. The
+			# buffer matches the socket's, so reading an ACK also takes in the whole response if it has already arrived.
+			self._file_handle = self._socket.makefile('rb', self.SOCKET_BUFFER_SIZE)
 		except:
 			if self._socket:
 				try:
@@ -205,48 +220,99 @@ class SerialIPCommunicator(SerialCommunicator):
 			raise ValueError('Cannot disconnect when not connected.')
 
 		try:
-			self._socket.close()
+			if self._file_handle:
+				self._file_handle.close()
 		finally:
-			self._socket = None
+			self._file_handle = None
+			try:
+				self._socket.close()
+			finally:
+				self._socket = None
 
 	def _send_data(self, data):
 		self._socket.sendall(data)
 
 	def _read_data(self, length):
-		return self._socket.recv(1)
+		data = self._file_handle.read(length)
+		if len(data) < length:
+			raise IOError('Connection closed after receiving %s of %s expected bytes.' % (len(data), length, ))
+		return data
 
 	@contextlib.contextmanager
 	def _get_file_handle(self):
-		handle = None
-		exc = None
-		try:
-			handle = self._socket.makefile()
-			yield handle
-		except Exception as e:
-			exc = e
-			raise
-		finally:
-			if handle:
-				# noinspection PyBroadException
-				try:
-					handle.close()
-				except:
-					if not exc:
-						raise
+		# The handle is shared with _read_data and lives as long as the connection, so it is not closed here
+		yield self._file_handle
 
 
 @six.add_metaclass(abc.ABCMeta)
 class ConfigurationSettingMixin(SerialCommunicator):
-	CONFIG_READ_INSTRUCTION = 'EEBRD %s %s\n'
-	CONFIG_WRITE_INSTRUCTION = 'EEBWR %s %s\n'
+	CONFIG_READ_INSTRUCTION = 'EEBRD %s %02X\n'
+	CONFIG_WRITE_INSTRUCTION = 'EEBWR %s %02X\n'
+
+	# The most read instructions sent before reading their responses, so that the console's input buffer can't overflow
+	CONFIG_READ_BATCH_SIZE = 8
+	# The most setting bytes read at once before updating the CRC with them
+	CONFIG_READ_CHUNK_SIZE = 256
 
-	CONFIG_SETTING_SETUP_BITS = ('2B', '01', )
+	CONFIG_SETTING_SETUP_BITS = ('2B', 1, )
 
+	SETUP_BITS_MASK_TIME_MODE_24_HOUR = 0b00000001
+	SETUP_BITS_MASK_IS_AM = 0b00000010
+	SETUP_BITS_MASK_DAY_MONTH_FORMAT = 0b00000100
+	SETUP_BITS_MASK_WIND_CUP_LARGE = 0b00001000
 	SETUP_BITS_MASK_RAIN_COLLECTOR = 0b00110000
+	SETUP_BITS_MASK_LATITUDE_NORTH = 0b01000000
+	SETUP_BITS_MASK_LONGITUDE_EAST = 0b10000000
+
+	SETUP_BITS_MASKS = {
+		'time_mode_24_hour': SETUP_BITS_MASK_TIME_MODE_24_HOUR,
+		'is_am': SETUP_BITS_MASK_IS_AM,
+		'day_month_format': SETUP_BITS_MASK_DAY_MONTH_FORMAT,
+		'wind_cup_large': SETUP_BITS_MASK_WIND_CUP_LARGE,
+		'rain_collector': SETUP_BITS_MASK_RAIN_COLLECTOR,
+		'latitude_north': SETUP_BITS_MASK_LATITUDE_NORTH,
+		'longitude_east': SETUP_BITS_MASK_LONGITUDE_EAST,
+	}
+
+	# Encoded read instructions keyed by (instruction, address, length), so that repeated reads of a setting reuse the
+	# same bytes; the instruction is part of the key because subclasses share this dict but may override it
+	_config_read_commands = {}
+	# The most encoded read instructions kept, since the addresses come from callers
+	CONFIG_READ_COMMAND_CACHE_SIZE = 256
 
 	def __init__(self, *args, **kwargs):
 		super(ConfigurationSettingMixin, self).__init__(*args, **kwargs)
 
+		self._rain_collector_type = None
+
+	def connect(self):
+		# The settings may have been changed at the console while disconnected, so nothing cached can be trusted
+		self._rain_collector_type = None
+		super(ConfigurationSettingMixin, self).connect()
+
+	def disconnect(self):
+		self._rain_collector_type = None
+		super(ConfigurationSettingMixin, self).disconnect()
+
+	@staticmethod
+	def _get_setting_length(setting_length):
+		"""
+		Returns the setting length as an integer, accepting either an integer or a number in hex string format.
+		"""
+		if isinstance(setting_length, six.string_types):
+			return int(setting_length, 16)
+		return setting_length
+
+	@classmethod
+	def _get_config_read_command(cls, setting_address, setting_length):
+		key = (cls.CONFIG_READ_INSTRUCTION, setting_address, setting_length, )
+		command = cls._config_read_commands.get(key)
+		if command is None:
+			command = (cls.CONFIG_READ_INSTRUCTION % (setting_address, setting_length, )).encode('ascii')
+			if len(cls._config_read_commands) < cls.CONFIG_READ_COMMAND_CACHE_SIZE:
+				cls._config_read_commands[key] = command
+		return command
+
 	def read_config_setting(self, setting_address, setting_length, confirm_crc=True, return_crc=False):
 		"""
 		Reads a configuration setting from the weather console. Returns the raw setting bytes and optionally
@@ -255,9 +321,9 @@ class ConfigurationSettingMixin(SerialCommunicator):
 
 		:param setting_address: The address at which the desired setting resides (a number in hex string format)
 		:type setting_address: str | unicode
-		:param setting_length: The length of the desired setting in bytes (a number in hex string format), not including
-								the two CRC bytes (that is added automatically)
-		:type setting_length: str | unicode
+		:param setting_length: The length of the desired setting in bytes (an integer or a number in hex string format),
+								not including the two CRC bytes (that is added automatically)
+		:type setting_length: int | str | unicode
 		:param confirm_crc: Whether the CRC should be checked (defaults to `True`)
 		:type confirm_crc: bool
 		:param return_crc: Whether the CRC should be included in the returned data (defaults to `False`)
@@ -268,15 +334,93 @@ class ConfigurationSettingMixin(SerialCommunicator):
 		:raises AcknowledgmentError: If an incorrect ACK is returned
 		:raises CRCValidationError: If `confirm_crc` is `True` and the CRC does not match
 		"""
-		self._send_instruction(self.CONFIG_READ_INSTRUCTION % (setting_address, setting_length, ))
+		setting_length = self._get_setting_length(setting_length)
+		self._send_instruction(self._get_config_read_command(setting_address, setting_length))
 
-		with self._get_file_handle() as handle:
-			setting = handle.read(int('0x%s' % setting_length, 16) + 2)  # must read the CRC
+		return self._read_config_setting_response(setting_length, confirm_crc, return_crc)
 
-		if confirm_crc and calculate_weatherlink_crc(setting) != 0:
-			raise CRCValidationError('CRC for response %s does not resolve to zero.' % repr(setting))
+	def read_config_settings_batch(self, settings, confirm_crc=True, return_crc=False):
+		"""
+		Reads multiple configuration settings from the weather console. Instead of waiting for each response before
+		sending the next instruction, the read instructions are sent together in groups of up to
+		`CONFIG_READ_BATCH_SIZE`, and then the responses are read in order, which saves a network round trip for every
+		setting after the first in each group. Returns a list of the raw setting bytes in the same order as the
+		requested settings. If reading any setting fails, the responses to the rest of its group are read and discarded
+		before the error is raised, so that the connection remains usable.
+
+		:param settings: An iterable of `(setting_address, setting_length)` tuples, in the same format accepted by
+							:func:`ConfigurationSettingMixin.read_config_setting`
+		:type settings: collections.Iterable[tuple]
+		:param confirm_crc: Whether the CRC of each setting should be checked (defaults to `True`)
+		:type confirm_crc: bool
+		:param return_crc: Whether the CRC should be included in each returned setting (defaults to `False`)
+		:type return_crc: bool
+
+		:return: The raw setting bytes for each setting, optionally including the CRC as the last two bytes
+		:rtype: list[str | bytes]
+		:raises AcknowledgmentError: If an incorrect ACK is returned for any setting
+		:raises CRCValidationError: If `confirm_crc` is `True` and the CRC does not match for any setting
+		"""
+		settings = [
+			(setting_address, self._get_setting_length(setting_length), )
+			for (setting_address, setting_length, ) in settings
+		]
+		results = []
+
+		for i in range(0, len(settings), self.CONFIG_READ_BATCH_SIZE):
+			batch = settings[i:i + self.CONFIG_READ_BATCH_SIZE]
+			self._send_data(b''.join(
+				self._get_config_read_command(setting_address, setting_length)
+				for (setting_address, setting_length, ) in batch
+			))
+
+			for j, (_, setting_length, ) in enumerate(batch):
+				try:
+					self.confirm_ack()
+					results.append(self._read_config_setting_response(setting_length, confirm_crc, return_crc))
+				except (AcknowledgmentError, CRCValidationError):
+					exception_info = sys.exc_info()
+					self._discard_config_setting_responses(batch[j + 1:])
+					six.reraise(*exception_info)
+
+		return results
+
+	def _discard_config_setting_responses(self, settings):
+		"""
+		Reads and throws away the responses to read instructions that have already been sent, so that they are not
+		mistaken for the response to the next instruction after a batch fails part of the way through.
+		"""
+		for _, setting_length in settings:
+			try:
+				self.confirm_ack()
+			except AcknowledgmentError:
+				continue  # The console sends no setting bytes after a NAK
+			self._read_config_setting_response(setting_length, False, False)
+
+	def _read_config_setting_response(self, setting_length, confirm_crc, return_crc):
+		expected_length = setting_length + 2  # must read the CRC
+		setting = bytearray()
+		crc = 0
 
-		return setting if return_crc else setting[:-2]
+		with self._get_file_handle() as handle:
+			# Read in chunks and update the CRC as each chunk arrives, so it's done by the time the last byte is read
+			while len(setting) < expected_length:
+				chunk = handle.read(min(self.CONFIG_READ_CHUNK_SIZE, expected_length - len(setting)))
+				if not chunk:
+					raise IOError('Connection closed after receiving %s of %s expected bytes.' % (
+						len(setting),
+						expected_length,
+					))
+				if confirm_crc:
+					crc = calculate_weatherlink_crc(chunk, crc)
+				setting += chunk
+
+		if crc != 0:
+			raise CRCValidationError('CRC for response %s does not resolve to zero.' % repr(bytes(setting)))
+
+		# Copy out of the read buffer only once, leaving off the CRC without an intermediate copy
+		view = memoryview(setting)
+		return (view if return_crc else view[:-2]).tobytes()
 
 	def write_config_setting(self, setting_address, setting_length, setting_value):
 		"""
@@ -285,9 +429,9 @@ class ConfigurationSettingMixin(SerialCommunicator):
 
 		:param setting_address: The address at which the desired setting resides (a number in hex string format)
 		:type setting_address: str | unicode
-		:param setting_length: The length of the desired setting in bytes (a number in hex string format), not including
-								the two CRC bytes (that is calculated and added automatically)
-		:type setting_length: str | unicode
+		:param setting_length: The length of the desired setting in bytes (an integer or a number in hex string format),
+								not including the two CRC bytes (that is calculated and added automatically)
+		:type setting_length: int | str | unicode
 		:param setting_value: The new setting value, not including the twe CRC bytes (that is calculated and added
 								automatically)
 		:type setting_value: str | bytes
@@ -297,10 +441,11 @@ class ConfigurationSettingMixin(SerialCommunicator):
 		:raises CRCValidationError: If the calculated CRC, appended to the setting value, does not result in a CRC
 									validation value of 0.
 		"""
-		if len(setting_value) != int('0x%s' % setting_length, 16):
+		setting_length = self._get_setting_length(setting_length)
+		if len(setting_value) != setting_length:
 			raise ValueError('The length of the setting value does not match the setting length.')
 
-		self._send_instruction(self.CONFIG_WRITE_INSTRUCTION % (setting_address, setting_length, ))
+		self._send_instruction((self.CONFIG_WRITE_INSTRUCTION % (setting_address, setting_length, )).encode('ascii'))
 
 		crc = calculate_weatherlink_crc(setting_value)
 		data = setting_value + struct.pack('>H', crc)  # Unlike other little-endian data, CRCs are big-endian (eye roll)
@@ -317,6 +462,12 @@ class ConfigurationSettingMixin(SerialCommunicator):
 
 		self._send_data(data)
 
+		# Forget the cached rain collector type if this write covered any of the setup bits
+		setup_bits_address = int(self.CONFIG_SETTING_SETUP_BITS[0], 16)
+		start_address = int(setting_address, 16)
+		if start_address <= setup_bits_address < start_address + setting_length:
+			self._rain_collector_type = None
+
 	def read_setup_bit(self, mask):
 		"""
 		Reads the 8 setup bits (1 byte) from the weather console and masks it with the given mask, returning the
@@ -330,16 +481,34 @@ class ConfigurationSettingMixin(SerialCommunicator):
 		:raises AcknowledgmentError: If an incorrect ACK is returned
 		:raises CRCValidationError: If the CRC does not match
 		"""
-		setup_bits = ord(self.read_config_setting(*self.CONFIG_SETTING_SETUP_BITS))
+		setup_bits = char_to_byte(self.read_config_setting(*self.CONFIG_SETTING_SETUP_BITS)[0])
 		return setup_bits & mask
 
+	def read_setup_bits_all(self):
+		"""
+		Reads the 8 setup bits (1 byte) from the weather console once and masks it with each of the masks in
+		`SETUP_BITS_MASKS`, returning a dict of the values of all the settings keyed by the same names. This saves a
+		round trip to the console for every setting after the first when more than one of them is needed.
+
+		:return: The values of the settings
+		:rtype: dict[str, int]
+		:raises AcknowledgmentError: If an incorrect ACK is returned
+		:raises CRCValidationError: If the CRC does not match
+		"""
+		setup_bits = char_to_byte(self.read_config_setting(*self.CONFIG_SETTING_SETUP_BITS)[0])
+		return {name: setup_bits & mask for name, mask in six.iteritems(self.SETUP_BITS_MASKS)}
+
 	def read_rain_collector_type(self):
 		"""
-		Reads and returns the rain collector type from the setup bits in the configuration settings.
+		Reads and returns the rain collector type from the setup bits in the configuration settings. The console is
+		only asked the first time; after that, the same value is returned until the setup bits are written with
+		:func:`ConfigurationSettingMixin.write_config_setting`.
 
 		:return: The rain collector type integer
 		:rtype: int
 		:raises AcknowledgmentError: If an incorrect ACK is returned
 		:raises CRCValidationError: If the CRC does not match
 		"""
-		return self.read_setup_bit(self.SETUP_BITS_MASK_RAIN_COLLECTOR)
+		if self._rain_collector_type is None:
+			self._rain_collector_type = self.read_setup_bits_all()['rain_collector']
+		return self._rain_collector_type
@@ -4,9 +4,12 @@ measurements. In addition to calculations for wet bulb temperature, dew point, h
 THW/THSW indexes, heating and cooling degree days, and high 10-minute wind average, it also includes conversion
 functions for various units of temperature, barometric pressure, and wind speed.
 
-It is important that all of the math in this module takes place using decimal precision. Floating-point precision is
-far too inaccurate and can cause errors of greater than plus/minus one degree in the results. As such, the first
-~100 lines of the code contain dozens of constants used in the aforementioned calculations. These constants come from
+All of the functions in this module accept and return decimal values. The unit conversions and the heat index
+calculations, which are rounded in ways that must exactly match published charts, also do their math using decimal
+precision. The formulas that are dominated by exponents and logarithms (wet bulb temperature, dew point, wind chill,
+and THSW index) instead do their math in double-precision floating point, which has far more precision than these
+empirical formulas have accuracy, and convert back to decimal only when rounding the result. The first ~100 lines of
+the code contain dozens of constants used in the aforementioned calculations. These constants come from
 documents published by NOAA / the National Weather Service of the United States of America, Davis Instruments,
 the Australian Bureau of Meteorology, and public domain imperial/SI conversion algorithms. Where possible/applicable,
 the source of algorithms and the constants they use are cited within the algorithm (not with the constants).
@@ -34,6 +37,14 @@ from __future__ import absolute_import
 import collections
 import datetime
 import decimal
+import functools
+import itertools
+import math
+
+try:
+	import numpy
+except ImportError:  # NumPy is optional and only needed for `calculate_all_record_values_batch`
+	numpy = None
 
 
 ZERO = decimal.Decimal('0')
@@ -42,35 +53,47 @@ TWO = decimal.Decimal('2')
 FOUR = decimal.Decimal('4')
 FIVE = decimal.Decimal('5')
 TEN = decimal.Decimal('10')
+SIXTY = decimal.Decimal('60')
 ONE_TENTH = decimal.Decimal('0.1')
 ONE_HUNDREDTH = ONE_TENTH * ONE_TENTH
 ONE_THOUSANDTH = ONE_TENTH * ONE_HUNDREDTH
 FIVE_NINTHS = decimal.Decimal('5.0') / decimal.Decimal('9.0')
 NINE_FIFTHS = decimal.Decimal('9.0') / decimal.Decimal('5.0')
 
+# Decimals for the small whole numbers (wind speeds, humidities, etc.) that are most often passed in as integers
+_SMALL_INTEGER_DECIMALS = {i: decimal.Decimal(i) for i in range(-100, 101)}
+
 CELSIUS_CONSTANT = decimal.Decimal('32')
 KELVIN_CONSTANT = decimal.Decimal('459.67')
 KILOPASCAL_MERCURY_CONSTANT = decimal.Decimal('0.295299830714')
 MILLIBAR_MERCURY_CONSTANT = KILOPASCAL_MERCURY_CONSTANT * ONE_TENTH
 METERS_PER_SECOND_CONSTANT = decimal.Decimal('0.44704')
 
+# Floating-point equivalents of the above, for the formulas that are calculated in floating point (the constants for
+# those formulas, below, are floating point, too)
+FIVE_NINTHS_FLOAT = 5.0 / 9.0
+NINE_FIFTHS_FLOAT = 9.0 / 5.0
+CELSIUS_CONSTANT_FLOAT = 32.0
+MILLIBAR_MERCURY_CONSTANT_FLOAT = 0.0295299830714
+METERS_PER_SECOND_CONSTANT_FLOAT = 0.44704
+
 # Wet bulb constants used by NOAA/NWS in its wet bulb temperature charts
-WB_0_00066 = decimal.Decimal('0.00066')
-WB_0_007 = decimal.Decimal('0.007')
-WB_0_114 = decimal.Decimal('0.114')
-WB_0_117 = decimal.Decimal('0.117')
-WB_2_5 = decimal.Decimal('2.5')
-WB_6_11 = decimal.Decimal('6.11')
-WB_7_5 = decimal.Decimal('7.5')
-WB_14_55 = decimal.Decimal('14.55')
-WB_15_9 = decimal.Decimal('15.9')
-WB_237_7 = decimal.Decimal('237.7')
+WB_0_00066 = 0.00066
+WB_0_007 = 0.007
+WB_0_114 = 0.114
+WB_0_117 = 0.117
+WB_2_5 = 2.5
+WB_6_11 = 6.11
+WB_7_5 = 7.5
+WB_14_55 = 14.55
+WB_15_9 = 15.9
+WB_237_7 = 237.7
 
 # Dew point constants used by NOAA/NWS in the August-Roche-Magnus approximation with the Bogel modification
-DP_A = decimal.Decimal('6.112')  # millibars
-DP_B = decimal.Decimal('17.67')  # no units
-DP_C = decimal.Decimal('243.5')  # degrees Celsius
-DP_D = decimal.Decimal('234.5')  # degrees Celsius
+DP_A = 6.112  # millibars
+DP_B = 17.67  # no units
+DP_C = 243.5  # degrees Celsius
+DP_D = 234.5  # degrees Celsius
 
 # Heat index constants used by NOAA/NWS in its heat index tables
 HI_SECOND_FORMULA_THRESHOLD = decimal.Decimal('80.0')
@@ -97,29 +120,36 @@ HI_85 = decimal.Decimal('85')
 HI_87 = decimal.Decimal('87')
 
 # Wind chill constants used by NOAA/NWS in its wind chill tables
-WC_C1 = decimal.Decimal('35.74')
-WC_C2 = decimal.Decimal('0.6215')
-WC_C3 = decimal.Decimal('35.75')
-WC_C4 = decimal.Decimal('0.4275')
-WC_V_EXP = decimal.Decimal('0.16')
+WC_C1 = 35.74
+WC_C2 = 0.6215
+WC_C3 = 35.75
+WC_C4 = 0.4275
+WC_V_EXP = 0.16
 
 # Constants used by Davis Instruments for its THW calculations
 THW_INDEX_CONSTANT = decimal.Decimal('1.072')
 
 # Constants used by the Australian Bureau of Meteorology for its apparent temperature (THSW) calculations
-THSW_0_25 = decimal.Decimal('0.25')
-THSW_0_348 = decimal.Decimal('0.348')
-THSW_0_70 = decimal.Decimal('0.70')
-THSW_4_25 = decimal.Decimal('4.25')
-THSW_6_105 = decimal.Decimal('6.105')
-THSW_17_27 = decimal.Decimal('17.27')
-THSW_237_7 = decimal.Decimal('237.7')
+THSW_0_25 = 0.25
+THSW_0_348 = 0.348
+THSW_0_70 = 0.70
+THSW_4_25 = 4.25
+THSW_6_105 = 6.105
+THSW_17_27 = 17.27
+THSW_237_7 = 237.7
+
+# Results are rounded to one decimal place, so irrational intermediate values (square roots) need only a dozen digits
+REDUCED_PRECISION_CONTEXT = decimal.Context(prec=12)
+
+# The rounding modes used when quantizing results, bound here to save a module attribute lookup on every call
+_ROUND_CEILING = decimal.ROUND_CEILING
+_ROUND_FLOOR = decimal.ROUND_FLOOR
+_ROUND_HALF_EVEN = decimal.ROUND_HALF_EVEN
 
 HEAT_INDEX_THRESHOLD = decimal.Decimal('70.0')  # degrees Fahrenheit
 WIND_CHILL_THRESHOLD = decimal.Decimal('40.0')  # degrees Fahrenheit
 DEGREE_DAYS_THRESHOLD = decimal.Decimal('65.0')  # degrees Fahrenheit
 
-
 def _as_decimal(value):
 	"""
 	Converts the value to a `Decimal` if it is not already, or returns the existing value if it is a `Decimal`, or
@@ -131,7 +161,41 @@ def _as_decimal(value):
 	:return: The value as a `Decimal`
 	:rtype: decimal.Decimal
 	"""
-	return value if isinstance(value, decimal.Decimal) else decimal.Decimal(value or '0')
+	if type(value) is decimal.Decimal:  # The most common case, and cheaper to check than `isinstance`
+		return value
+	if not value:
+		return ZERO
+	if isinstance(value, decimal.Decimal):
+		return value
+	return _SMALL_INTEGER_DECIMALS.get(value) or decimal.Decimal(value)
+
+
+def _as_float(value):
+	"""
+	Converts the value to a `float`, or returns `0.0` if the existing value is `None`.
+
+	:param value: The value to cast/convert
+	:type value: int | long | decimal.Decimal | NoneType
+
+	:return: The value as a `float`
+	:rtype: float
+	"""
+	return float(value or 0)
+
+
+def _float_to_decimal(value, rounding=_ROUND_HALF_EVEN):
+	"""
+	Converts the floating-point result of a calculation back to a `Decimal` rounded to one decimal place.
+
+	:param value: The value to convert
+	:type value: float
+	:param rounding: The decimal rounding mode to use (defaults to `decimal.ROUND_HALF_EVEN`)
+	:type rounding: str
+
+	:return: The value as a `Decimal` to one decimal place
+	:rtype: decimal.Decimal
+	"""
+	return decimal.Decimal(value).quantize(ONE_TENTH, rounding=rounding)
 
 
 def convert_fahrenheit_to_kelvin(temperature):
@@ -250,22 +314,34 @@ def calculate_wet_bulb_temperature(temperature, relative_humidity, barometric_pr
 	:return: The wet bulb temperature in degrees Fahrenheit to one decimal place
 	:rtype: decimal.Decimal
 	"""
-	Tc = convert_fahrenheit_to_celsius(temperature)
-	RH = _as_decimal(relative_humidity)
-	P = convert_inches_of_mercury_to_millibars(barometric_pressure)
+	return _float_to_decimal(_wet_bulb_temperature(
+		_as_float(temperature),
+		_as_float(relative_humidity),
+		_as_float(barometric_pressure),
+	))
 
-	Tdc = (
-		Tc - (WB_14_55 + WB_0_114 * Tc) * (1 - (ONE_HUNDREDTH * RH)) -
-		((WB_2_5 + WB_0_007 * Tc) * (1 - (ONE_HUNDREDTH * RH))) ** 3 -
-		(WB_15_9 + WB_0_117 * Tc) * (1 - (ONE_HUNDREDTH * RH)) ** 14
-	)
-	E = WB_6_11 * 10 ** (WB_7_5 * Tdc / (WB_237_7 + Tdc))
-	Tw = (
-		(((WB_0_00066 * P) * Tc) + ((4098 * E) / ((Tdc + WB_237_7) ** 2) * Tdc)) /
-		((WB_0_00066 * P) + (4098 * E) / ((Tdc + WB_237_7) ** 2))
-	)
 
-	return convert_celsius_to_fahrenheit(Tw).quantize(ONE_TENTH)
+# noinspection PyPep8Naming
+def _wet_bulb_temperature(temperature, RH, barometric_pressure):
+	"""
+	The floating-point formula behind `calculate_wet_bulb_temperature`, which takes and returns floats (or NumPy arrays
+	of them) in degrees Fahrenheit instead of decimals.
+	"""
+	Tc = (temperature - CELSIUS_CONSTANT_FLOAT) * FIVE_NINTHS_FLOAT
+	P = barometric_pressure / MILLIBAR_MERCURY_CONSTANT_FLOAT
+
+	# These subexpressions are each used more than once below, so they are only calculated once
+	H = 1 - (0.01 * RH)  # the humidity deficit
+	C = (WB_2_5 + WB_0_007 * Tc) * H
+	# Small integer powers are cheaper as plain multiplication, but `** 14` is not (it would take five multiplications)
+	Tdc = Tc - (WB_14_55 + WB_0_114 * Tc) * H - C * C * C - (WB_15_9 + WB_0_117 * Tc) * H ** 14
+	D = Tdc + WB_237_7
+	E = WB_6_11 * 10 ** (WB_7_5 * Tdc / D)
+	G = WB_0_00066 * P  # the psychrometric term
+	S = (4098 * E) / (D * D)  # the slope of the vapor pressure curve
+	Tw = ((G * Tc) + (S * Tdc)) / (G + S)
+
+	return Tw * NINE_FIFTHS_FLOAT + CELSIUS_CONSTANT_FLOAT
 
 
 # noinspection PyPep8Naming
@@ -287,22 +363,29 @@ def calculate_dew_point(temperature, relative_humidity):
 
 	:return: The dew point temperature in degrees Fahrenheit to one decimal place
 	:rtype: decimal.Decimal
+	:raises decimal.InvalidOperation: If the relative humidity is not greater than 0
 	"""
-	Tc = convert_fahrenheit_to_celsius(temperature)
-	RH = _as_decimal(relative_humidity)
+	RH = _as_float(relative_humidity)
+	if RH <= 0:
+		# The formula takes the logarithm of the humidity, as the decimal formula did, so this fails the same way
+		raise decimal.InvalidOperation('The dew point cannot be calculated for a relative humidity of %s.' % RH)
 
-	Ym = (
-		RH / 100 * (
-			(DP_B - (Tc / DP_D)) * (Tc / (DP_C + Tc))
-		).exp()
-	).ln()
-	Tdc = (DP_C * Ym) / (DP_B - Ym)
+	return _float_to_decimal(_dew_point(_as_float(temperature), RH))
 
-	return convert_celsius_to_fahrenheit(Tdc).quantize(ONE_TENTH)
 
+# noinspection PyPep8Naming
+def _dew_point(temperature, RH, log=math.log):
+	"""
+	The floating-point formula behind `calculate_dew_point`, which takes and returns floats in degrees Fahrenheit
+	instead of decimals. Pass NumPy's `log` to calculate over arrays.
+	"""
+	Tc = (temperature - CELSIUS_CONSTANT_FLOAT) * FIVE_NINTHS_FLOAT
 
-def _abs(d):
-	return max(d, -d)
+	# This is ln(RH / 100 * e^x), but the logarithm of the exponential cancels out, leaving just the one logarithm
+	Ym = log(RH / 100) + (DP_B - (Tc / DP_D)) * (Tc / (DP_C + Tc))
+	Tdc = (DP_C * Ym) / (DP_B - Ym)
+
+	return Tdc * NINE_FIFTHS_FLOAT + CELSIUS_CONSTANT_FLOAT
 
 
 # noinspection PyPep8Naming
@@ -341,17 +424,19 @@ def calculate_heat_index(temperature, relative_humidity):
 	heat_index = (heat_index + T) / TWO  # This is the average
 
 	if heat_index < HI_SECOND_FORMULA_THRESHOLD:
-		return heat_index.quantize(ONE_TENTH, rounding=decimal.ROUND_CEILING)
+		return heat_index.quantize(ONE_TENTH, rounding=_ROUND_CEILING)
 
+	# This is the Rothfusz regression, factored by powers of RH and T so that it takes 8 multiplications instead of 18
 	heat_index = (
-		HI_C1 + (HI_C2 * T) + (HI_C3 * RH) + (HI_C4 * T * RH) + (HI_C5 * T * T) +
-		(HI_C6 * RH * RH) + (HI_C7 * T * T * RH) + (HI_C8 * T * RH * RH) + (HI_C9 * T * T * RH * RH)
+		HI_C1 + T * (HI_C2 + T * HI_C5) +
+		RH * (HI_C3 + T * (HI_C4 + T * HI_C7) + RH * (HI_C6 + T * (HI_C8 + T * HI_C9)))
 	)
 
 	if (HI_FIRST_ADJUSTMENT_THRESHOLD[0] <= T <= HI_FIRST_ADJUSTMENT_THRESHOLD[1] and
 				RH < HI_FIRST_ADJUSTMENT_THRESHOLD[2]):
 		heat_index -= (
-			((HI_13 - RH) / FOUR) * ((HI_17 - _abs(T - HI_95)) / HI_17).sqrt()
+			((HI_13 - RH) / FOUR) *
+			REDUCED_PRECISION_CONTEXT.divide(HI_17 - (T - HI_95).copy_abs(), HI_17).sqrt(REDUCED_PRECISION_CONTEXT)
 		)
 	elif (HI_SECOND_ADJUSTMENT_THRESHOLD[0] <= T <= HI_SECOND_ADJUSTMENT_THRESHOLD[1] and
 							RH > HI_SECOND_ADJUSTMENT_THRESHOLD[2]):
@@ -359,7 +444,7 @@ def calculate_heat_index(temperature, relative_humidity):
 			((RH - HI_85) / TEN) * ((HI_87 - T) / FIVE)
 		)
 
-	return heat_index.quantize(ONE_TENTH, rounding=decimal.ROUND_CEILING)
+	return heat_index.quantize(ONE_TENTH, rounding=_ROUND_CEILING)
 
 
 # noinspection PyPep8Naming
@@ -385,22 +470,39 @@ def calculate_wind_chill(temperature, wind_speed):
 	:return: The wind chill temperature in degrees Fahrenheit to one decimal place, or `None` if the temperature is
 				higher than 40F
 	:rtype: decimal.Decimal
+	:raises decimal.InvalidOperation: If the wind speed is negative
 	"""
 	if temperature > WIND_CHILL_THRESHOLD:
 		return None
 
-	T = temperature
-	WS = _as_decimal(wind_speed)
+	WS = _as_float(wind_speed)
+	if WS < 0:
+		# A fractional power of a negative number is complex, so this fails the same way the decimal formula did
+		raise decimal.InvalidOperation('The wind chill cannot be calculated for a wind speed of %s.' % WS)
+
+	if WS == 0:  # No wind results in no chill, so skip it
+		return temperature
+
+	return _wind_chill_to_decimal(temperature, _wind_chill(_as_float(temperature), WS))
 
-	if WS == ZERO:  # No wind results in no chill, so skip it
-		return T
 
+# noinspection PyPep8Naming
+def _wind_chill(T, WS):
+	"""
+	The floating-point formula behind `calculate_wind_chill`, which takes and returns floats (or NumPy arrays of them)
+	instead of decimals and does not apply the temperature threshold or the no-wind and no-chill cases.
+	"""
 	V = WS ** WC_V_EXP
-	wind_chill = (
-		WC_C1 + (WC_C2 * T) - (WC_C3 * V) + (WC_C4 * T * V)
-	).quantize(ONE_TENTH, rounding=decimal.ROUND_FLOOR)
+	return WC_C1 + (WC_C2 * T) - (WC_C3 * V) + (WC_C4 * T * V)
 
-	return T if wind_chill > T else wind_chill
+
+def _wind_chill_to_decimal(temperature, wind_chill):
+	"""
+	Converts the floating-point result of `_wind_chill` back to a `Decimal`, rounded down to one decimal place, or
+	returns the temperature instead if the wind chill would be higher than it.
+	"""
+	wind_chill = _float_to_decimal(wind_chill, rounding=_ROUND_FLOOR)
+	return temperature if wind_chill > temperature else wind_chill
 
 
 # noinspection PyPep8Naming
@@ -427,12 +529,15 @@ def calculate_thw_index(temperature, relative_humidity, wind_speed):
 				less than 70F
 	:rtype: decimal.Decimal
 	"""
-	hi = calculate_heat_index(temperature, relative_humidity)
 	WS = _as_decimal(wind_speed)
+	if not WS:
+		# There is no wind adjustment to make in still air
+		return calculate_heat_index(temperature, relative_humidity)
 
+	hi = calculate_heat_index(temperature, relative_humidity)
 	if not hi:
 		return None
-	return hi - (THW_INDEX_CONSTANT * WS).quantize(ONE_TENTH, rounding=decimal.ROUND_CEILING)
+	return hi - (THW_INDEX_CONSTANT * WS).quantize(ONE_TENTH, rounding=_ROUND_CEILING)
 
 
 # noinspection PyPep8Naming
@@ -471,11 +576,39 @@ def calculate_thsw_index(temperature, relative_humidity, solar_radiation, wind_s
 	:return: The THSW index temperature in degrees Fahrenheit to one decimal place
 	:rtype: decimal.Decimal
 	"""
-	Tc = convert_fahrenheit_to_celsius(temperature)
-	RH = _as_decimal(relative_humidity)
-	Q1 = _as_decimal(solar_radiation)
-	WS = convert_miles_per_hour_to_meters_per_second(_as_decimal(wind_speed))
+	return _float_to_decimal(_thsw_index(
+		_as_float(temperature),
+		_as_float(relative_humidity),
+		_as_float(solar_radiation),
+		_as_float(wind_speed),
+	))
+
+
+# noinspection PyPep8Naming
+def _thsw_index(temperature, RH, Q1, wind_speed, exp=math.exp):
+	"""
+	The floating-point formula behind `calculate_thsw_index`, which takes and returns floats in degrees Fahrenheit and
+	miles per hour instead of decimals. Pass NumPy's `exp` to calculate over arrays.
+	"""
+	Tc = (temperature - CELSIUS_CONSTANT_FLOAT) * FIVE_NINTHS_FLOAT
+	WS = wind_speed * METERS_PER_SECOND_CONSTANT_FLOAT
+
+	return _thsw_index_precomputed(Tc, _thsw_vapor_pressure(Tc, RH, exp), _thsw_absorbed_radiation(Q1), WS)
+
 
+# noinspection PyPep8Naming
+def _thsw_vapor_pressure(Tc, RH, exp=math.exp):
+	"""
+	The water vapor pressure term of the THSW index formula, which depends only on the temperature and humidity.
+	"""
+	return RH / 100 * THSW_6_105 * exp(THSW_17_27 * Tc / (THSW_237_7 + Tc))
+
+
+# noinspection PyPep8Naming
+def _thsw_absorbed_radiation(Q1):
+	"""
+	The total thermal radiation term of the THSW index formula, which depends only on the solar radiation.
+	"""
 	# TODO We know Q1 (input variable), and we know that Q1 = QD + Qd. But we need Qd. To do that, we need to figure
 	# TODO out how much of Q1 is Qd. So we calculate what QDe and Qde (e = expected) should be based on the angle of
 	# TODO the sun in the sky using radiation tables. Given that Q1e = QDe + Qde, we can solve for x in xQ1e = Q1
@@ -488,12 +621,34 @@ def calculate_thsw_index(temperature, relative_humidity, solar_radiation, wind_s
 
 	Q2 = Qd / 7
 	Q3 = Q1 / 28
-	Q = Q2 + Q3
+	return Q2 + Q3
+
 
-	E = RH / 100 * THSW_6_105 * (THSW_17_27 * Tc / (THSW_237_7 + Tc)).exp()
+# noinspection PyPep8Naming
+def _thsw_index_precomputed(Tc, E, Q, WS):
+	"""
+	The remainder of the THSW index formula, given the temperature in degrees Celsius, the water vapor pressure, the
+	total thermal radiation, and the wind speed in meters per second.
+	"""
 	Thsw = Tc + (THSW_0_348 * E) - (THSW_0_70 * WS) + ((THSW_0_70 * Q) / (WS + 10)) - THSW_4_25
 
-	return convert_celsius_to_fahrenheit(Thsw).quantize(ONE_TENTH)
+	return Thsw * NINE_FIFTHS_FLOAT + CELSIUS_CONSTANT_FLOAT
+
+
+def _calculate_thsw_indexes(temperatures, relative_humidity, solar_radiations, wind_speeds):
+	"""
+	Calculates the THSW index for every combination of the solar radiations, temperatures, and wind speeds, in that
+	order of precedence, converting each distinct input and calculating each partial result only once.
+	"""
+	RH = _as_float(relative_humidity)
+	Ts = []
+	for temperature in temperatures:
+		Tc = (_as_float(temperature) - CELSIUS_CONSTANT_FLOAT) * FIVE_NINTHS_FLOAT
+		Ts.append((Tc, _thsw_vapor_pressure(Tc, RH), ))
+	Qs = [_thsw_absorbed_radiation(_as_float(S)) for S in solar_radiations]
+	WSs = [_as_float(W) * METERS_PER_SECOND_CONSTANT_FLOAT for W in wind_speeds]
+
+	return [_float_to_decimal(_thsw_index_precomputed(Tc, E, Q, WS)) for Q in Qs for (Tc, E, ) in Ts for WS in WSs]
 
 
 def calculate_cooling_degree_days(average_temperature):
@@ -584,8 +739,10 @@ def calculate_10_minute_wind_average(records):
 	direction_queue = collections.deque(maxlen=10)
 	timestamp_queue = collections.deque(maxlen=10)
 	current_max = ZERO
-	current_direction_list = []
-	current_timestamp_list = []
+	current_sum = ZERO
+	current_directions = ()
+	current_start = None
+	current_end = None
 
 	for (wind_speed, wind_speed_direction, timestamp_station, minutes_covered, ) in records:
 		minutes_covered = int(minutes_covered)
@@ -597,8 +754,13 @@ def calculate_10_minute_wind_average(records):
 
 		# We want each record to be present in the queue the same number of times as minutes it spans
 		# So if a record spans 5 minutes, it counts as 5 items in the 10-minute queue
-		speed_queue.extend([wind_speed] * minutes_covered)
-		direction_queue.extend([wind_speed_direction] * minutes_covered)
+		# The sum of the queue is kept running, so the samples falling off the front must be subtracted from it
+		for _ in range(minutes_covered):
+			if len(speed_queue) == 10:
+				current_sum -= speed_queue[0]
+			speed_queue.append(wind_speed)
+			current_sum += wind_speed
+		direction_queue.extend(itertools.repeat(wind_speed_direction, minutes_covered))
 
 		# The timestamp is special, because we need to do some math with it
 		if minutes_covered == 1:
@@ -611,27 +773,24 @@ def calculate_10_minute_wind_average(records):
 
 		if len(speed_queue) == 10:
 			# This is the rolling average of the last 10 minutes
-			average = sum(speed_queue) / 10
+			average = current_sum / TEN
 			if average > current_max:
 				current_max = average
-				current_direction_list = list(direction_queue)
-				current_timestamp_list = list(timestamp_queue)
+				current_directions = tuple(direction_queue)
+				current_start = timestamp_queue[0]
+				current_end = timestamp_queue[-1]
 
 	if current_max > ZERO:
 		wind_speed_high_10_minute_average = current_max
 
 		wind_speed_high_10_minute_average_direction = None
-		wind_speed_high_10_minute_average_start = None
-		wind_speed_high_10_minute_average_end = None
+		wind_speed_high_10_minute_average_start = current_start
+		wind_speed_high_10_minute_average_end = current_end
 
-		if current_direction_list:
-			count = collections.Counter(current_direction_list)
+		if current_directions:
+			count = collections.Counter(current_directions)
 			wind_speed_high_10_minute_average_direction = count.most_common()[0][0]
 
-		if current_timestamp_list:
-			wind_speed_high_10_minute_average_start = current_timestamp_list[0]
-			wind_speed_high_10_minute_average_end = current_timestamp_list[-1]
-
 		return (
 			wind_speed_high_10_minute_average,
 			wind_speed_high_10_minute_average_direction,
@@ -643,11 +802,158 @@ def calculate_10_minute_wind_average(records):
 
 
 def _append_to_list(l, v):
-	if v:
+	if v is not None:
 		l.append(v)
 
 
+def _distinct(values):
+	"""
+	Returns the values that are not `None`, in their original order, without any repeats.
+	"""
+	distinct = []
+	for value in values:
+		if value is not None and value not in distinct:
+			distinct.append(value)
+	return distinct
+
+
 def calculate_all_record_values(record):
+	return _calculate_all_record_values(
+		record,
+		calculate_wet_bulb_temperature,
+		calculate_dew_point,
+		calculate_wind_chill,
+		_calculate_thsw_indexes,
+	)
+
+
+def calculate_all_record_values_batch(records):
+	"""
+	Calculates the same values as `calculate_all_record_values` for each of many records, returning a list of the
+	results in the same order as the records. If NumPy is installed, the floating-point formulas (wet bulb temperature,
+	dew point, wind chill, and THSW index) are first calculated in one pass over arrays of every distinct set of inputs
+	in the batch, instead of once per call per record, and the results are then looked up as each record's values are
+	assembled. Otherwise, this is the same as calling `calculate_all_record_values` for each record.
+
+	:param records: The records for which to calculate values
+	:type records: collections.Iterable[dict]
+
+	:return: The calculated values for each record
+	:rtype: list[dict]
+	"""
+	records = list(records)
+	if not numpy:
+		return [calculate_all_record_values(record) for record in records]
+
+	wet_bulb_arguments = set()
+	dew_point_arguments = set()
+	wind_chill_arguments = set()
+	thsw_arguments = set()
+
+	for record in records:
+		humidity_outside = record.get('humidity_outside')
+		barometric_pressure = record.get('barometric_pressure')
+		wind_speed = _as_decimal(record.get('wind_speed'))
+		wind_speed_high = record.get('wind_speed_high')
+		temperatures = [
+			t for t in (
+				record.get('temperature_outside'),
+				record.get('temperature_outside_low'),
+				record.get('temperature_outside_high'),
+			) if t is not None
+		]
+
+		for temperature in temperatures:
+			if humidity_outside:
+				dew_point_arguments.add((temperature, humidity_outside, ))
+				if barometric_pressure:
+					wet_bulb_arguments.add((temperature, humidity_outside, barometric_pressure, ))
+				for solar_radiation in (record.get('solar_radiation'), record.get('solar_radiation_high'), ):
+					if solar_radiation:
+						thsw_arguments.add((temperature, humidity_outside, solar_radiation, wind_speed or 0, ))
+						thsw_arguments.add((temperature, humidity_outside, solar_radiation, wind_speed_high or 0, ))
+			if temperature <= WIND_CHILL_THRESHOLD:
+				for speed in (wind_speed, wind_speed_high, ):
+					if speed:
+						wind_chill_arguments.add((temperature, speed, ))
+
+		if record.get('humidity_inside') and record.get('temperature_inside'):
+			dew_point_arguments.add((record['temperature_inside'], record['humidity_inside'], ))
+
+	def convert_wind_chill(arguments, result):
+		return _wind_chill_to_decimal(arguments[0], result)
+
+	calculate_thsw = _get_batch_calculator(
+		calculate_thsw_index,
+		thsw_arguments,
+		functools.partial(_thsw_index, exp=numpy.exp),
+	)
+
+	def calculate_thsw_indexes(temperatures, relative_humidity, solar_radiations, wind_speeds):
+		return [
+			calculate_thsw(T, relative_humidity, S, W)
+			for S in solar_radiations for T in temperatures for W in wind_speeds
+		]
+
+	calculators = (
+		_get_batch_calculator(
+			calculate_wet_bulb_temperature,
+			wet_bulb_arguments,
+			_wet_bulb_temperature,
+		),
+		_get_batch_calculator(
+			calculate_dew_point,
+			dew_point_arguments,
+			functools.partial(_dew_point, log=numpy.log),
+		),
+		_get_batch_calculator(
+			calculate_wind_chill,
+			wind_chill_arguments,
+			_wind_chill,
+			convert_wind_chill,
+		),
+		calculate_thsw_indexes,
+	)
+
+	return [_calculate_all_record_values(record, *calculators) for record in records]
+
+
+def _get_batch_calculator(function, arguments, formula, convert=None):
+	"""
+	Calculates the floating-point `formula` over NumPy arrays of all the given sets of `arguments` at once, and returns
+	a function with the same signature as `function` that looks up the results, falling back to calling `function` for
+	arguments that were not calculated (or did not have a finite result).
+	"""
+	arguments = list(arguments)
+	results = {}
+
+	if arguments:
+		columns = numpy.array(arguments, dtype=numpy.float64).T
+		with numpy.errstate(all='ignore'):
+			values = formula(*columns)
+
+		for argument_set, value, finite in zip(arguments, values.tolist(), numpy.isfinite(values).tolist()):
+			if finite:
+				results[argument_set] = convert(argument_set, value) if convert else _float_to_decimal(value)
+
+	def calculate(*argument_set):
+		try:
+			return results[argument_set]
+		except KeyError:
+			return function(*argument_set)
+
+	return calculate
+
+
+def _calculate_all_record_values(
+	record,
+	wet_bulb,
+	dew_point,
+	wind_chill,
+	thsw_indexes,
+):
+	# The floating-point calculations (`calculate_wet_bulb_temperature`, `calculate_dew_point`, `calculate_wind_chill`,
+	# and `_calculate_thsw_indexes`) are passed in so that `calculate_all_record_values_batch` can substitute them
 	arguments = {}
 
 	wind_speed = _as_decimal(record.get('wind_speed'))
@@ -663,36 +969,35 @@ def calculate_all_record_values(record):
 	solar_radiation_high = record.get('solar_radiation_high')
 
 	if wind_speed:
-		ws_mpm = wind_speed / 60
+		ws_mpm = wind_speed / SIXTY
 		distance = ws_mpm * record['minutes_covered']
 		arguments['wind_run_distance_total'] = distance
 
+	# A temperature of zero is a real reading (missing temperatures are `None`), so it must not be treated as absent.
+	# The low and high readings often equal the current one, so each distinct temperature is only calculated once.
+	temperatures_outside = _distinct((temperature_outside, temperature_outside_high, temperature_outside_low, ))
+
 	if humidity_outside and barometric_pressure:
-		if temperature_outside:
-			a = calculate_wet_bulb_temperature(temperature_outside, humidity_outside, barometric_pressure)
-			if a:
-				arguments['temperature_wet_bulb'] = a
-		if temperature_outside_low:
-			a = calculate_wet_bulb_temperature(temperature_outside_low, humidity_outside, barometric_pressure)
-			if a:
-				arguments['temperature_wet_bulb_low'] = a
-		if temperature_outside_high:
-			a = calculate_wet_bulb_temperature(temperature_outside_high, humidity_outside, barometric_pressure)
-			if a:
-				arguments['temperature_wet_bulb_high'] = a
+		wet_bulb_temperatures = dict(
+			(T, wet_bulb(T, humidity_outside, barometric_pressure), ) for T in temperatures_outside
+		)
+		for key, T in (
+			('temperature_wet_bulb', temperature_outside, ),
+			('temperature_wet_bulb_low', temperature_outside_low, ),
+			('temperature_wet_bulb_high', temperature_outside_high, ),
+		):
+			if T is not None:
+				arguments[key] = wet_bulb_temperatures[T]
 
 	if humidity_outside:
+		dew_points = dict((T, dew_point(T, humidity_outside), ) for T in temperatures_outside)
+		heat_indexes = dict((T, calculate_heat_index(T, humidity_outside), ) for T in temperatures_outside)
 		a = []
 		b = []
-		if temperature_outside:
-			_append_to_list(a, calculate_dew_point(temperature_outside, humidity_outside))
-			_append_to_list(b, calculate_heat_index(temperature_outside, humidity_outside))
-		if temperature_outside_low:
-			_append_to_list(a, calculate_dew_point(temperature_outside_low, humidity_outside))
-			_append_to_list(b, calculate_heat_index(temperature_outside_low, humidity_outside))
-		if temperature_outside_high:
-			_append_to_list(a, calculate_dew_point(temperature_outside_high, humidity_outside))
-			_append_to_list(b, calculate_heat_index(temperature_outside_high, humidity_outside))
+		for T in (temperature_outside, temperature_outside_low, temperature_outside_high, ):
+			if T is not None:
+				_append_to_list(a, dew_points[T])
+				_append_to_list(b, heat_indexes[T])
 		if a:
 			arguments['dew_point_outside'] = a[0]
 			arguments['dew_point_outside_low'] = min(a)
@@ -702,102 +1007,47 @@ def calculate_all_record_values(record):
 			arguments['heat_index_outside_low'] = min(b)
 			arguments['heat_index_outside_high'] = max(b)
 
-	if humidity_inside and temperature_inside:
-		a = calculate_dew_point(temperature_inside, humidity_inside)
+	if humidity_inside and temperature_inside is not None:
+		a = dew_point(temperature_inside, humidity_inside)
 		b = calculate_heat_index(temperature_inside, humidity_inside)
-		if a:
+		if a is not None:
 			arguments['dew_point_inside'] = a
-		if b:
+		if b is not None:
 			arguments['heat_index_inside'] = b
 
-	if (wind_speed or wind_speed_high) and (temperature_outside or temperature_outside_high or temperature_outside_low):
+	if (wind_speed or wind_speed_high) and temperatures_outside:
 		a = []
-		if wind_speed and temperature_outside:
-			_append_to_list(a, calculate_wind_chill(temperature_outside, wind_speed))
-		if wind_speed and temperature_outside_high:
-			_append_to_list(a, calculate_wind_chill(temperature_outside_high, wind_speed))
-		if wind_speed and temperature_outside_low:
-			_append_to_list(a, calculate_wind_chill(temperature_outside_low, wind_speed))
-		if wind_speed_high and temperature_outside:
-			_append_to_list(a, calculate_wind_chill(temperature_outside, wind_speed_high))
-		if wind_speed_high and temperature_outside_high:
-			_append_to_list(a, calculate_wind_chill(temperature_outside_high, wind_speed_high))
-		if wind_speed_high and temperature_outside_low:
-			_append_to_list(a, calculate_wind_chill(temperature_outside_low, wind_speed_high))
+		for W in _distinct(W for W in (wind_speed, wind_speed_high, ) if W):
+			for T in temperatures_outside:
+				_append_to_list(a, wind_chill(T, W))
 		if a:
 			arguments['wind_chill'] = a[0]
 			arguments['wind_chill_low'] = min(a)
 			arguments['wind_chill_high'] = max(a)
 
-	if humidity_outside and (temperature_outside or temperature_outside_high or temperature_outside_low):
+	if humidity_outside and temperatures_outside:
 		ws = wind_speed if wind_speed else 0
 		wsh = wind_speed_high if wind_speed_high else 0
+		# In still air both wind speeds are the same, and each combination would otherwise be calculated twice
+		wind_speeds = (ws, ) if ws == wsh else (ws, wsh, )
 
-		a = []
-		if temperature_outside:
-			_append_to_list(a, calculate_thw_index(temperature_outside, humidity_outside, ws))
-			_append_to_list(a, calculate_thw_index(temperature_outside, humidity_outside, wsh))
-		if temperature_outside_high:
-			_append_to_list(a, calculate_thw_index(temperature_outside_high, humidity_outside, ws))
-			_append_to_list(a, calculate_thw_index(temperature_outside_high, humidity_outside, wsh))
-		if temperature_outside_low:
-			_append_to_list(a, calculate_thw_index(temperature_outside_low, humidity_outside, ws))
-			_append_to_list(a, calculate_thw_index(temperature_outside_low, humidity_outside, wsh))
+		a = [
+			v for v in (calculate_thw_index(T, humidity_outside, W) for T in temperatures_outside for W in wind_speeds)
+			if v is not None
+		]
 		if a:
 			arguments['thw_index'] = a[0]
 			arguments['thw_index_low'] = min(a)
 			arguments['thw_index_high'] = max(a)
 
 		if solar_radiation or solar_radiation_high:
-			a = []
-			if temperature_outside and solar_radiation:
-				_append_to_list(a, calculate_thsw_index(temperature_outside, humidity_outside, solar_radiation, ws))
-				_append_to_list(a, calculate_thsw_index(temperature_outside, humidity_outside, solar_radiation, wsh))
-			if temperature_outside_high and solar_radiation:
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside_high, humidity_outside, solar_radiation, ws),
-				)
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside_high, humidity_outside, solar_radiation, wsh),
-				)
-			if temperature_outside_low and solar_radiation:
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside_low, humidity_outside, solar_radiation, ws),
-				)
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside_low, humidity_outside, solar_radiation, wsh),
-				)
-			if temperature_outside and solar_radiation_high:
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside, humidity_outside, solar_radiation_high, ws),
-				)
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside, humidity_outside, solar_radiation_high, wsh),
-				)
-			if temperature_outside_high and solar_radiation_high:
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside_high, humidity_outside, solar_radiation_high, ws),
-				)
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside_high, humidity_outside, solar_radiation_high, wsh),
-				)
-			if temperature_outside_low and solar_radiation_high:
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside_low, humidity_outside, solar_radiation_high, ws),
-				)
-				_append_to_list(
-					a,
-					calculate_thsw_index(temperature_outside_low, humidity_outside, solar_radiation_high, wsh),
-				)
+			# Every combination of solar radiation, temperature, and wind speed, in that order of precedence
+			a = thsw_indexes(
+				temperatures_outside,
+				humidity_outside,
+				_distinct(S for S in (solar_radiation, solar_radiation_high, ) if S),
+				wind_speeds,
+			)
 			if a:
 				arguments['thsw_index'] = a[0]
 				arguments['thsw_index_low'] = min(a)